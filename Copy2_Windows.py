@@ -45,12 +45,19 @@ import time
 import zipfile
 import tempfile
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import subprocess
-import shutil
 import webbrowser
 import base64
+import binascii
+import queue
 import hashlib
+import bisect
+import functools
+import itertools
 import secrets
+import struct
+import mmap
 import ctypes
 
 # --- Windows taskbar identity (must be set before creating any Tk window) ---
@@ -61,6 +68,34 @@ if os.name == "nt":
     except Exception:
         pass
 
+# --- Win32 clipboard prototypes ---
+# Declared once so ctypes does not re-infer argument types per call and 64-bit handles/pointers
+# are not truncated to C int. Signatures match the ones pyperclip sets on the same functions.
+USER32 = KERNEL32 = None
+if os.name == "nt":
+    try:
+        from ctypes import wintypes
+        USER32 = ctypes.windll.user32
+        KERNEL32 = ctypes.windll.kernel32
+        for _fn, _args, _res in (
+            (USER32.OpenClipboard, [wintypes.HWND], wintypes.BOOL),
+            (USER32.CloseClipboard, [], wintypes.BOOL),
+            (USER32.EmptyClipboard, [], wintypes.BOOL),
+            (USER32.GetClipboardData, [wintypes.UINT], wintypes.HANDLE),
+            (USER32.SetClipboardData, [wintypes.UINT, wintypes.HANDLE], wintypes.HANDLE),
+            (USER32.RegisterClipboardFormatW, [wintypes.LPCWSTR], wintypes.UINT),
+            (USER32.GetClipboardSequenceNumber, [], wintypes.DWORD),
+            (KERNEL32.GlobalAlloc, [wintypes.UINT, ctypes.c_size_t], wintypes.HGLOBAL),
+            (KERNEL32.GlobalFree, [wintypes.HGLOBAL], wintypes.HGLOBAL),
+            (KERNEL32.GlobalLock, [wintypes.HGLOBAL], wintypes.LPVOID),
+            (KERNEL32.GlobalUnlock, [wintypes.HGLOBAL], wintypes.BOOL),
+            (KERNEL32.GlobalSize, [wintypes.HGLOBAL], ctypes.c_size_t),
+        ):
+            _fn.argtypes = _args
+            _fn.restype = _res
+    except Exception:
+        USER32 = KERNEL32 = None
+
 # Optional: imaging (clipboard images + screenshots)
 try:
     from PIL import Image, ImageTk, ImageGrab  # type: ignore
@@ -73,13 +108,17 @@ try:
 except Exception:
     Fernet = None
 
-# Optional: key derivation for encryption-at-rest and encrypted exports
+# Optional: AES-GCM for the compact binary image envelope (.c2img)
 try:
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC  # type: ignore
-    from cryptography.hazmat.primitives import hashes  # type: ignore
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM  # type: ignore
 except Exception:
-    PBKDF2HMAC = None
-    hashes = None
+    AESGCM = None
+
+# Optional: faster JSON serialization for the data stores
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
 
 # Optional: Windows start-on-boot
 try:
@@ -158,6 +197,30 @@ DEFAULT_POLL_MS = 400
 # and the app will warn that you have used all allocated memory.
 HARD_MAX_HISTORY = 500
 
+# Manifest member name inside .zip export packages
+EXPORT_MANIFEST = "copy2_export.json"
+
+# Sync files at least this large are hashed (and, with orjson, parsed) straight from a read-only mmap
+MMAP_JSON_MIN_BYTES = 64 * 1024
+
+# Collapses whitespace runs when rendering one-line list previews
+_WS_RE = re.compile(r"\s+")
+
+# str.translate table for the "strip hidden characters" format action: NBSP -> space,
+# drop zero-width chars/BOM and ASCII control chars other than \n, \t, \r.
+_INVIS_TABLE = {0x00A0: 0x20, 0x200B: None, 0x200C: None, 0x200D: None, 0xFEFF: None}
+_INVIS_TABLE.update((c, None) for c in range(32) if c not in (0x09, 0x0A, 0x0D))
+# Same deletions as _INVIS_TABLE (minus NBSP); str.translate leaves its fast path on non-ASCII text
+_INVIS_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\u200b-\u200d\ufeff]+")
+
+# Preview format tools
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+_URL_RE = re.compile(r"https?://\S+")
+# Spaces/tabs before a line ending (\r\n, \n, \r) or the end of the text
+_TRAIL_WS_RE = re.compile(r"[ \t]+(?=[\r\n]|\Z)")
+# Spaces/tabs at the start of a line (any str.splitlines() boundary)
+_LEAD_WS_RE = re.compile(r"(?:^|(?<=[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]))[ \t]+")
+
 # GitHub update config
 GITHUB_OWNER = "MellowsLab"
 GITHUB_REPO = "Copy-2.0-Windows"
@@ -173,13 +236,62 @@ def now_ts() -> str:
 
 def safe_json_load(path: Path, default):
     try:
-        if not path.exists():
-            return default
-        return json.loads(path.read_text(encoding="utf-8"))
+        data = path.read_bytes()
+    except Exception:
+        return default
+    if not data:
+        return default
+    try:
+        return json_loads_bytes(data)
     except Exception:
         return default
 
 
+def json_load_if_changed(path: Path, known: bytes | None = None):
+    """Return (digest, obj) for a JSON file; obj is None if unreadable or its bytes hash to known.
+
+    Cloud sync clients bump mtimes without changing content; hashing the bytes is far cheaper
+    than re-parsing them. digest is None when the file could not be read/parsed.
+    """
+    try:
+        with open(path, 'rb') as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size <= 0:
+                return None, None
+            if size < MMAP_JSON_MIN_BYTES:
+                data = fh.read()
+            else:
+                # Large sync files: hash (and with orjson, parse) the mapping itself instead of
+                # copying the whole file into a bytes object first
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as mv:
+                        digest = hashlib.blake2b(mv, digest_size=16).digest()
+                        if known is not None and digest == known:
+                            return digest, None
+                        if orjson is not None:
+                            try:
+                                return digest, orjson.loads(mv)
+                            except Exception:
+                                return None, None
+                    # stdlib json cannot parse a buffer
+                    data = mm[:]
+                try:
+                    return digest, json_loads_bytes(data)
+                except Exception:
+                    return None, None
+    except Exception:
+        return None, None
+    if not data:
+        return None, None
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    if known is not None and digest == known:
+        return digest, None
+    try:
+        return digest, json_loads_bytes(data)
+    except Exception:
+        return None, None
+
+
 def safe_json_save(path: Path, obj) -> None:
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -188,6 +300,130 @@ def safe_json_save(path: Path, obj) -> None:
         pass
 
 
+def json_dumps_bytes(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except Exception:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_dump_file(obj, path, indent: int | None = 2) -> None:
+    """Write obj as UTF-8 JSON to path without building an intermediate str.
+
+    orjson encodes straight to bytes (2-space indent only); otherwise json.dump streams into the file.
+    indent=None writes compact JSON with no separator padding.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except Exception:
+            data = None
+        if data is not None:
+            with open(path, 'wb') as fh:
+                fh.write(data)
+            return
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump(obj, fh, ensure_ascii=False, indent=indent,
+                  separators=None if indent else (',', ':'))
+
+
+def json_loads_bytes(data: bytes):
+    """Parse UTF-8 JSON bytes (orjson when available). Undecodable bytes are dropped, as with errors='ignore'."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except Exception:
+            pass
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError:
+        return json.loads(data.decode('utf-8', errors='ignore'))
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a sibling temp file, then os.replace() it over path.
+
+    Readers (and sync clients watching the folder) never observe a partially written file.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            tmp.unlink()
+        except Exception:
+            pass
+        raise
+
+
+def deque_filter_inplace(dq: deque, keep) -> int:
+    """Drop items of dq for which keep(x) is false, reusing the deque (and its maxlen). Returns removed count.
+
+    Untouched when nothing is removed; otherwise one C-level filtering pass plus clear()/extend().
+    """
+    kept = [x for x in dq if keep(x)]
+    removed = len(dq) - len(kept)
+    if removed:
+        dq.clear()
+        dq.extend(kept)
+    return removed
+
+
+def normalize_tags(obj) -> dict:
+    """Tags store as loaded from disk -> {str key: non-empty list of unique stripped tag names}.
+
+    Everything that edits tags keeps this shape, so consumers can test entries with a plain truthiness check.
+    """
+    out = {}
+    if not isinstance(obj, dict):
+        return out
+    for k, v in obj.items():
+        if not isinstance(k, str) or not isinstance(v, list):
+            continue
+        vals = list(dict.fromkeys(s for s in (str(t).strip() for t in v) if s))
+        if vals:
+            out[k] = vals
+    return out
+
+
+def str_items(data) -> list:
+    """Coerce a parsed JSON list to str items, dropping non-scalars.
+
+    JSON stores written by this app are already all-str, so that case reuses the list as-is.
+    """
+    if all(type(x) is str for x in data):
+        return data
+    return [str(x) for x in data if isinstance(x, (str, int, float))]
+
+
+def common_affix_lengths(a: str, b: str) -> tuple[int, int]:
+    """
+    Length of the common prefix and (non-overlapping) common suffix of a and b.
+    Bisects with slice comparisons so the scanning happens in C, not per character.
+    """
+    limit = min(len(a), len(b))
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    prefix = lo
+    lo, hi = 0, limit - prefix
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return prefix, lo
+
+
 def _norm_ver(v: str) -> tuple[int, int, int]:
     """
     Normalize versions like:
@@ -447,6 +683,16 @@ SETTINGS
 '''
 
 
+@functools.lru_cache(maxsize=1)
+def _help_text() -> str:
+    """Normalized Settings → Help text; the source block is fixed for the process, so build it once."""
+    # Accept either COPY2_HELP_TEXT (recommended) or a user-edited help_text block
+    src = globals().get('help_text', None)
+    if src is None:
+        src = globals().get('COPY2_HELP_TEXT', '')
+    return _normalize_text_block(src).strip() or '(Help content is empty.)'
+
+
 # -----------------------------
 # GitHub update helpers
 # -----------------------------
@@ -843,6 +1089,8 @@ class Copy2AppBase:
 
         # Rich formats map: key = the stored text value, value = dict with optional html_b64/rtf_b64
         self.clip_formats = {}
+        # Decoded HTML/RTF bytes per text, validated against the b64 strings they came from
+        self._clip_formats_raw = {}
 
         # Advanced runtime state (optional features are OFF by default)
         sec = safe_json_load(self.security_path, {})
@@ -891,12 +1139,7 @@ class Copy2AppBase:
                 else:
                     favs = []
                 # preserve order, unique
-                seen = set()
-                self.favorites = []
-                for x in favs:
-                    if x not in seen:
-                        self.favorites.append(x)
-                        seen.add(x)
+                self.favorites = list(dict.fromkeys(favs))
 
                 # Pins
                 pins = self._store_load_json(self.pins_path, [])
@@ -904,35 +1147,10 @@ class Copy2AppBase:
                     pins = [x for x in pins if isinstance(x, str)]
                 else:
                     pins = []
-                self.pins = []
-                seenp = set()
-                for x in pins:
-                    if x not in seenp:
-                        self.pins.append(x)
-                        seenp.add(x)
+                self.pins = list(dict.fromkeys(pins))
 
                 # Tags: {clip_text: [tag, ...]}
-                tags = self._store_load_json(self.tags_path, {})
-                if not isinstance(tags, dict):
-                    tags = {}
-                norm_tags = {}
-                for k,v in tags.items():
-                    if not isinstance(k, str):
-                        continue
-                    if isinstance(v, list):
-                        vals = [str(t).strip() for t in v if str(t).strip()]
-                    else:
-                        vals = []
-                    # unique preserve order
-                    seen_t=set()
-                    out=[]
-                    for t in vals:
-                        if t not in seen_t:
-                            out.append(t)
-                            seen_t.add(t)
-                    if out:
-                        norm_tags[k]=out
-                self.tags = norm_tags
+                self.tags = normalize_tags(self._store_load_json(self.tags_path, {}))
 
                 # Tag colors: {tag_name: '#RRGGBB'}
                 tc = self._store_load_json(self.tag_colors_path, {})
@@ -996,12 +1214,21 @@ class Copy2AppBase:
         # Polling
         self._poll_job = None
 
+        # Coalesced persistence (see _mark_dirty / _flush_dirty)
+        self._dirty_stores: set[str] = set()
+        self._persist_job = None
+
         # View model
         self.view_items: list[str] = []
 
         # Selection ordering for Combine
         self._prev_sel_set: set[int] = set()
-        self._sel_order: list[int] = []
+        self._sel_order: dict[int, None] = {}  # insertion-ordered set of selected rows
+
+        # Compiled subsequence patterns for _fuzzy_match, keyed by lowered query
+        self._fuzzy_re_cache: dict[str, re.Pattern] = {}
+        # Bounded memo of str.lower() for search (items/tags repeat across keystrokes)
+        self._lower_cache: dict[str, str] = {}
 
         # Preview edit model
         self._selected_item_text: str | None = None  # original selected item
@@ -1266,6 +1493,15 @@ class Copy2AppBase:
                     self.after_cancel(self._idle_after_id)
             except Exception:
                 pass
+            try:
+                # Drop pending coalesced writes so nothing is re-written after the wipe
+                if getattr(self, '_persist_job', None) is not None:
+                    self.after_cancel(self._persist_job)
+                self._persist_job = None
+                self._dirty_stores = set()
+            except Exception:
+                pass
+            self._forget_enc_keys()
 
             # Clear in-memory state quickly (best-effort)
             try:
@@ -1342,6 +1578,7 @@ class Copy2AppBase:
         self.security['pin_iters'] = iters
         self.security['pin_hash'] = h
         self._pin_session_verified = True
+        self._forget_enc_keys()
         self._save_security()
         messagebox.showinfo(APP_NAME, 'PIN updated.')
 
@@ -1978,9 +2215,9 @@ Thanks — {signature}""",
             if self._enc_all_enabled() and getattr(self, '_session_pin', None) and Fernet is not None:
                 from pathlib import Path as _P
                 b = _P(str(fpath)).read_bytes()
-                env = self._encrypt_image_bytes(b, self._session_pin, ext='png')
+                blob = self._encrypt_image_bytes(b, self._session_pin, ext='png')
                 enc_path = self.images_dir / f"img_{ts}_{rid}.c2img"
-                enc_path.write_text(json.dumps(env, ensure_ascii=False, indent=2), encoding='utf-8')
+                enc_path.write_bytes(blob)
                 try:
                     _P(str(fpath)).unlink()
                 except Exception:
@@ -2078,8 +2315,8 @@ Thanks — {signature}""",
             GMEM_MOVEABLE = 0x0002
             CF_DIB = 8
 
-            user32 = ctypes.windll.user32
-            kernel32 = ctypes.windll.kernel32
+            user32 = USER32
+            kernel32 = KERNEL32
 
             if not user32.OpenClipboard(None):
                 return False
@@ -2152,7 +2389,14 @@ Thanks — {signature}""",
     # Data folder + encryption helpers
     # -----------------------------
     _ENC_MAGIC = "__copy2_enc__"
-    _ENC_V = 1
+    _ENC_V = 1          # Fernet envelope (read path; written only when AES-GCM is unavailable)
+    _ENC_V_GCM = 2      # AES-256-GCM envelope with the session key
+    _ENC_VERSIONS = (_ENC_V, _ENC_V_GCM)
+    _KDF_ITERS = 200_000
+    # Binary image envelope (.c2img): magic, version, iters, salt, nonce
+    _IMG_MAGIC = b"C2I1"
+    _IMG_V = 1
+    _IMG_HDR_FMT = ">4sBI16s12s"
 
     def _open_data_folder(self):
         """Open the app data directory in Explorer."""
@@ -2538,6 +2782,10 @@ Thanks — {signature}""",
 
     def _show_lock_overlay(self, reason: str = "Locked"):
         self._ensure_lock_overlay()
+        # Drop decoded image previews and cached derived keys while locked
+        self._img_preview_cache = {}
+        self._img_preview_src = None
+        self._forget_enc_keys()
         try:
             if getattr(self, '_lock_err_var', None) is not None:
                 self._lock_err_var.set("")
@@ -2668,10 +2916,12 @@ Thanks — {signature}""",
                 # Merge any items captured while locked
                 pending = list(getattr(self, '_captured_while_locked', []) or [])
                 if pending:
+                    seen = set(self.history)
                     for t in pending:
                         try:
-                            if isinstance(t, str) and t and t not in self.history:
+                            if isinstance(t, str) and t and t not in seen:
                                 self.history.append(t)
+                                seen.add(t)
                         except Exception:
                             pass
                     try:
@@ -2681,6 +2931,10 @@ Thanks — {signature}""",
         except Exception:
             pass
 
+        # Store writes held back while no PIN was available go out now
+        if getattr(self, '_dirty_stores', None):
+            self._mark_dirty()
+
         try:
             self._refresh_list(select_last=True)
         except Exception:
@@ -2697,27 +2951,84 @@ Thanks — {signature}""",
         except Exception:
             pass
 
-    def _kdf_fernet_key(self, pin: str, salt: bytes, iters: int = 200_000) -> bytes:
-        import base64
+    def _kdf_raw_key(self, pin: str, salt: bytes, iters: int = 200_000) -> bytes:
+        """Derive a raw 32-byte key from the PIN (PBKDF2-SHA256).
+
+        hashlib runs the whole derivation (HMAC pad setup included) in C and yields the same
+        key as cryptography's PBKDF2HMAC, so existing encrypted stores still open.
+        """
         try:
-            if PBKDF2HMAC is None or hashes is None:
-                raise RuntimeError("PBKDF2 unavailable")
-            kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=iters)
-            key = kdf.derive(pin.encode('utf-8'))
-            return base64.urlsafe_b64encode(key)
+            return hashlib.pbkdf2_hmac('sha256', pin.encode('utf-8'), salt, int(iters), dklen=32)
         except Exception:
             # Last-resort fallback (weak): deterministic SHA256
-            import hashlib
-            key = hashlib.sha256((pin + salt.hex()).encode('utf-8')).digest()[:32]
-            return base64.urlsafe_b64encode(key)
+            return hashlib.sha256((pin + salt.hex()).encode('utf-8')).digest()[:32]
+
+    def _kdf_fernet_key(self, pin: str, salt: bytes, iters: int = 200_000) -> bytes:
+        return base64.urlsafe_b64encode(self._kdf_raw_key(pin, salt, iters))
+
+    def _pin_cache_id(self, pin: str) -> bytes:
+        """Keyed digest standing in for the PIN in key caches, so the caches never hold the PIN itself.
+
+        Keyed with a per-process random secret: the digest is useless for offline guessing.
+        """
+        secret = getattr(self, '_pin_cache_secret', None)
+        if secret is None:
+            secret = self._pin_cache_secret = secrets.token_bytes(32)
+        return hashlib.blake2b(pin.encode('utf-8'), key=secret, digest_size=16).digest()
+
+    def _forget_enc_keys(self):
+        """Drop every derived key held for this session (PIN change, lock, wipe)."""
+        self._kdf_cache = {}
+        self._enc_session = None
+
+    def _kdf_key_cached(self, pin: str, salt: bytes, iters: int) -> bytes:
+        """_kdf_raw_key memoised per (PIN digest, salt, iters) so each envelope salt costs one PBKDF2 run per session."""
+        cache = getattr(self, '_kdf_cache', None)
+        if cache is None:
+            cache = self._kdf_cache = {}
+        ck = (self._pin_cache_id(pin), bytes(salt), int(iters))
+        key = cache.get(ck)
+        if key is None:
+            if len(cache) >= 64:
+                cache.clear()
+            key = cache[ck] = self._kdf_raw_key(pin, salt, int(iters))
+        return key
+
+    def _session_enc_key(self, pin: str) -> tuple[bytes, int, bytes]:
+        """Return (salt, iters, key) used for writing during this session; derived once per PIN."""
+        cur = getattr(self, '_enc_session', None)
+        pin_id = self._pin_cache_id(pin)
+        if cur is None or cur[0] != pin_id:
+            salt = secrets.token_bytes(16)
+            iters = self._KDF_ITERS
+            cur = self._enc_session = (pin_id, salt, iters, self._kdf_key_cached(pin, salt, iters))
+        return cur[1], cur[2], cur[3]
+
+    def _encrypt_json_obj(self, obj: object, pin: str, payload: bytes | None = None, legacy: bool = False) -> dict:
+        """Encrypt obj into a store envelope. `payload` may carry obj already serialized to JSON bytes.
+
+        legacy=True always writes the v1 Fernet envelope (used for export files, which older
+        builds must still be able to import).
+        """
+        if payload is None:
+            payload = json_dumps_bytes(obj)
+        if AESGCM is not None and not legacy:
+            salt, iters, key = self._session_enc_key(pin)
+            nonce = secrets.token_bytes(12)
+            aad = f"{self._ENC_MAGIC}:{self._ENC_V_GCM}".encode('ascii')
+            ct = AESGCM(key).encrypt(nonce, payload, aad)
+            return {
+                self._ENC_MAGIC: self._ENC_V_GCM,
+                "salt_b64": base64.b64encode(salt).decode('ascii'),
+                "iters": iters,
+                "nonce_b64": base64.b64encode(nonce).decode('ascii'),
+                "ct_b64": base64.b64encode(ct).decode('ascii'),
+            }
 
-    def _encrypt_json_obj(self, obj: object, pin: str) -> dict:
-        import base64
         salt = secrets.token_bytes(16)
-        iters = 200_000
+        iters = self._KDF_ITERS
         key = self._kdf_fernet_key(pin, salt, iters)
         f = Fernet(key)
-        payload = json.dumps(obj, ensure_ascii=False).encode('utf-8')
         token = f.encrypt(payload)
         return {
             self._ENC_MAGIC: self._ENC_V,
@@ -2727,37 +3038,82 @@ Thanks — {signature}""",
         }
 
     def _decrypt_json_obj(self, env: dict, pin: str):
-        import base64
         salt = base64.b64decode(str(env.get('salt_b64') or ''))
-        iters = int(env.get('iters') or 200_000)
+        iters = int(env.get('iters') or self._KDF_ITERS)
+        key = self._kdf_key_cached(pin, salt, iters)
+        if env.get(self._ENC_MAGIC) == self._ENC_V_GCM:
+            if AESGCM is None:
+                raise RuntimeError("AES-GCM unavailable")
+            nonce = base64.b64decode(str(env.get('nonce_b64') or ''))
+            ct = base64.b64decode(str(env.get('ct_b64') or ''))
+            aad = f"{self._ENC_MAGIC}:{self._ENC_V_GCM}".encode('ascii')
+            return json.loads(AESGCM(key).decrypt(nonce, ct, aad))
+
         token = str(env.get('token') or '').encode('ascii')
-        key = self._kdf_fernet_key(pin, salt, iters)
-        f = Fernet(key)
+        f = Fernet(base64.urlsafe_b64encode(key))
         raw = f.decrypt(token)
         return json.loads(raw.decode('utf-8'))
 
-    def _encrypt_image_bytes(self, blob: bytes, pin: str, ext: str = 'png') -> dict:
-        """Encrypt raw image bytes into a Copy2 envelope (stored on disk as JSON)."""
-        import base64
+    def _encrypt_image_bytes(self, blob: bytes, pin: str, ext: str = 'png') -> bytes:
+        """Encrypt raw image bytes into the on-disk .c2img format.
+
+        Preferred format is a compact binary envelope:
+          magic(4) | version(u8) | iters(u32) | salt(16) | nonce(12) | AES-GCM ciphertext
+        The header is authenticated as associated data.
+        Falls back to the legacy JSON/Fernet envelope when AES-GCM is unavailable.
+        """
+        if AESGCM is not None:
+            salt, iters, key = self._session_enc_key(pin)
+            nonce = secrets.token_bytes(12)
+            header = struct.pack(self._IMG_HDR_FMT, self._IMG_MAGIC, self._IMG_V, iters, salt, nonce)
+            return header + AESGCM(key).encrypt(nonce, bytes(blob), header)
+
         try:
             data_b64 = base64.b64encode(blob).decode('ascii')
         except Exception:
             data_b64 = ''
-        return self._encrypt_json_obj({"data_b64": data_b64, "ext": ext}, pin)
+        env = self._encrypt_json_obj({"data_b64": data_b64, "ext": ext}, pin)
+        return json_dumps_bytes(env)
+
+    def _decrypt_image_file_bytes(self, raw: bytes, pin: str) -> tuple[bytes, str | None] | None:
+        """Decrypt .c2img file contents. Returns (image_bytes, ext or None), or None on failure.
+
+        Reads both the binary envelope and the legacy JSON/Fernet envelope.
+        """
+        hdr_len = struct.calcsize(self._IMG_HDR_FMT)
+        if raw[:4] == self._IMG_MAGIC:
+            if AESGCM is None or len(raw) < hdr_len:
+                return None
+            header = raw[:hdr_len]
+            _magic, ver, iters, salt, nonce = struct.unpack(self._IMG_HDR_FMT, header)
+            if ver != self._IMG_V:
+                return None
+            key = self._kdf_key_cached(pin, salt, int(iters))
+            return AESGCM(key).decrypt(nonce, raw[hdr_len:], header), None
+
+        # Legacy JSON envelope
+        if Fernet is None:
+            return None
+        raw_env = json.loads(raw.decode('utf-8', errors='ignore'))
+        if not (isinstance(raw_env, dict) and raw_env.get(self._ENC_MAGIC) in self._ENC_VERSIONS):
+            return None
+        data = self._decrypt_json_obj(raw_env, pin)
+        if not isinstance(data, dict) or 'data_b64' not in data:
+            return None
+        return base64.b64decode(str(data.get('data_b64') or '')), (str(data.get('ext') or '') or None)
 
     def _store_load_json(self, p: Path, default):
         """Load JSON, supporting Copy2 encrypted envelopes when encrypt-all is enabled."""
         try:
             if not p.exists():
                 return default
-            txt = p.read_text(encoding='utf-8', errors='ignore')
-            data = json.loads(txt)
+            data = json_loads_bytes(p.read_bytes())
         except Exception:
             return default
 
         # Encrypted envelope
         try:
-            if isinstance(data, dict) and data.get(self._ENC_MAGIC) == self._ENC_V:
+            if isinstance(data, dict) and data.get(self._ENC_MAGIC) in self._ENC_VERSIONS:
                 pin = getattr(self, '_session_pin', None)
                 if not pin:
                     return default
@@ -2770,28 +3126,59 @@ Thanks — {signature}""",
 
         return data if data is not None else default
 
-    def _store_save_json(self, p: Path, obj: object):
-        """Save JSON, encrypting when encrypt-all is enabled and a session PIN is present."""
+    def _store_save_json(self, p: Path, obj: object, enc_on: bool | None = None, pin: str | None = None):
+        """Save JSON, encrypting when encrypt-all is enabled and a session PIN is present.
+
+        Batch writers may pass enc_on/pin (resolved once per batch) to skip re-checking per file.
+        The write is skipped when the payload, encryption mode and on-disk file are unchanged
+        since our last save (avoids re-encrypting and re-syncing idle stores).
+        """
         try:
             p.parent.mkdir(parents=True, exist_ok=True)
         except Exception:
             pass
 
-        if self._enc_all_enabled():
+        if enc_on is None:
+            enc_on = self._enc_all_enabled()
             pin = getattr(self, '_session_pin', None)
-            if pin:
-                try:
-                    env = self._encrypt_json_obj(obj, pin)
-                    p.write_text(json.dumps(env, ensure_ascii=False, indent=2), encoding='utf-8')
+        enc_pin = pin if (enc_on and pin) else None
+
+        try:
+            payload = json_dumps_bytes(obj)
+        except Exception:
+            return
+
+        sigs = getattr(self, '_store_hash', None)
+        if sigs is None:
+            sigs = self._store_hash = {}
+        hkey = str(p)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        prev = sigs.get(hkey)
+        if prev is not None and prev[0] == digest and prev[1] == enc_pin:
+            try:
+                st = p.stat()
+                if (st.st_mtime_ns, st.st_size) == prev[2]:
                     return
-                except Exception:
-                    pass
+            except Exception:
+                pass
+
+        data = None
+        if enc_pin:
+            try:
+                data = json_dumps_bytes(self._encrypt_json_obj(obj, enc_pin, payload=payload))
+            except Exception:
+                data = None
+                enc_pin = None
 
         # Plaintext fallback
+        if data is None:
+            data = payload
         try:
-            p.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding='utf-8')
+            atomic_write_bytes(p, data)
+            st = p.stat()
+            sigs[hkey] = (digest, enc_pin, (st.st_mtime_ns, st.st_size))
         except Exception:
-            pass
+            sigs.pop(hkey, None)
 
     def _load_image_bytes(self, rec: dict) -> bytes | None:
         """Load raw image bytes, supporting encrypted .c2img files."""
@@ -2800,19 +3187,11 @@ Thanks — {signature}""",
             if not path or not os.path.exists(path):
                 return None
             if path.lower().endswith('.c2img'):
-                if Fernet is None:
-                    return None
                 pin = getattr(self, '_session_pin', None)
                 if not pin:
                     return None
-                raw_env = json.loads(Path(path).read_text(encoding='utf-8', errors='ignore'))
-                if not (isinstance(raw_env, dict) and raw_env.get(self._ENC_MAGIC) == self._ENC_V):
-                    return None
-                data = self._decrypt_json_obj(raw_env, pin)
-                if isinstance(data, dict) and 'data_b64' in data:
-                    import base64
-                    return base64.b64decode(data['data_b64'])
-                return None
+                res = self._decrypt_image_file_bytes(Path(path).read_bytes(), pin)
+                return res[0] if res is not None else None
             # Plain image
             return Path(path).read_bytes()
         except Exception:
@@ -2832,6 +3211,7 @@ Thanks — {signature}""",
             if not pin:
                 return
 
+            jobs = []
             for rec in list(self.images):
                 try:
                     path = str(rec.get('path') or '').strip()
@@ -2840,47 +3220,58 @@ Thanks — {signature}""",
                     p = Path(path)
                     if not p.exists():
                         continue
-
-                    if encrypt:
-                        if p.suffix.lower() == '.c2img':
-                            rec['enc'] = True
-                            continue
-                        raw = p.read_bytes()
-                        ext = (rec.get('ext') or p.suffix.lstrip('.').lower() or 'png')
-                        env = self._encrypt_image_bytes(raw, pin, ext=str(ext))
-                        outp = p.with_suffix('.c2img')
-                        outp.write_text(json.dumps(env, ensure_ascii=False, indent=2), encoding='utf-8')
-                        try:
-                            p.unlink(missing_ok=True)
-                        except Exception:
-                            pass
-                        rec['path'] = str(outp)
+                    if encrypt and p.suffix.lower() == '.c2img':
                         rec['enc'] = True
-                        rec['ext'] = ext
-                    else:
-                        # Decrypt
-                        if p.suffix.lower() != '.c2img':
-                            rec['enc'] = False
-                            continue
-                        raw_env = json.loads(p.read_text(encoding='utf-8', errors='ignore'))
-                        if not (isinstance(raw_env, dict) and raw_env.get(self._ENC_MAGIC) == self._ENC_V):
-                            continue
-                        data = self._decrypt_json_obj(raw_env, pin)
-                        if not isinstance(data, dict) or 'data_b64' not in data:
-                            continue
-                        ext = str(data.get('ext') or rec.get('ext') or 'png')
-                        raw = base64.b64decode(str(data.get('data_b64') or ''))
-                        outp = p.with_suffix('.' + ext)
-                        outp.write_bytes(raw)
-                        try:
-                            p.unlink(missing_ok=True)
-                        except Exception:
-                            pass
-                        rec['path'] = str(outp)
+                        continue
+                    if not encrypt and p.suffix.lower() != '.c2img':
                         rec['enc'] = False
-                        rec['ext'] = ext
+                        continue
+                    jobs.append((rec, p, rec.get('ext')))
                 except Exception:
                     continue
+            if not jobs:
+                return
+
+            if encrypt:
+                # Derive the session key up front so workers don't race to run PBKDF2.
+                self._session_enc_key(pin)
+
+            def _convert(p: Path, rec_ext):
+                """Read, convert and replace one image file. Returns (new_path, ext) or None."""
+                if encrypt:
+                    ext = str(rec_ext or p.suffix.lstrip('.').lower() or 'png')
+                    data = self._encrypt_image_bytes(p.read_bytes(), pin, ext=ext)
+                    outp = p.with_suffix('.c2img')
+                else:
+                    res = self._decrypt_image_file_bytes(p.read_bytes(), pin)
+                    if res is None:
+                        return None
+                    data, env_ext = res
+                    ext = str(env_ext or rec_ext or 'png')
+                    outp = p.with_suffix('.' + ext)
+                outp.write_bytes(data)
+                try:
+                    p.unlink(missing_ok=True)
+                except Exception:
+                    pass
+                return outp, ext
+
+            # AES-GCM and hashlib's PBKDF2 release the GIL, so a small pool overlaps crypto with file IO.
+            workers = max(1, min(8, os.cpu_count() or 2, len(jobs)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futs = {pool.submit(_convert, p, ext): rec for rec, p, ext in jobs}
+                for fut in as_completed(futs):
+                    try:
+                        res = fut.result()
+                    except Exception:
+                        continue
+                    if res is None:
+                        continue
+                    rec = futs[fut]
+                    self._bump_images()
+                    rec['path'] = str(res[0])
+                    rec['enc'] = bool(encrypt)
+                    rec['ext'] = res[1]
         except Exception:
             return
 
@@ -2912,20 +3303,20 @@ Thanks — {signature}""",
         # History
         try:
             hist = self._store_load_json(self.history_path, [])
-            self.history = deque([x for x in (hist or []) if isinstance(x, str) and x.strip()], maxlen=self.settings.max_history)
+            self.history = deque((x for x in (hist or []) if isinstance(x, str) and x.strip()), maxlen=self.settings.max_history)
         except Exception:
             pass
         # Lists/dicts
         try:
-            self.favorites = list(self._store_load_json(self.favs_path, []))
+            self.favorites = list(dict.fromkeys(self._store_load_json(self.favs_path, [])))
         except Exception:
             self.favorites = []
         try:
-            self.pins = list(self._store_load_json(self.pins_path, []))
+            self.pins = list(dict.fromkeys(self._store_load_json(self.pins_path, [])))
         except Exception:
             self.pins = []
         try:
-            self.tags = self._store_load_json(self.tags_path, {}) or {}
+            self.tags = normalize_tags(self._store_load_json(self.tags_path, {}))
         except Exception:
             self.tags = {}
         try:
@@ -2941,57 +3332,232 @@ Thanks — {signature}""",
             self.clip_formats = fmts if isinstance(fmts, dict) else {}
         except Exception:
             self.clip_formats = {}
-        try:
+        self._clip_formats_raw = {}
+
+        # Images/snippets are rarely needed right after unlock; decrypt them on first access instead.
+        def _load_images():
             meta = self._store_load_json(self.images_meta_path, [])
-            self.images = meta if isinstance(meta, list) else []
-        except Exception:
-            self.images = []
-        try:
+            return meta if isinstance(meta, list) else []
+
+        def _load_snippets():
             sn = self._store_load_json(self.snippets_path, {'templates': []})
-            self.snippets = sn.get('templates', []) if isinstance(sn, dict) else []
-        except Exception:
-            self.snippets = []
+            return sn.get('templates', []) if isinstance(sn, dict) else []
 
-    def _persist(self):
-        """Persist settings and state. When Encrypt-All is enabled, sensitive stores are encrypted."""
-        # Always persist settings (plaintext; required to know whether encryption/lock are enabled).
-        safe_json_save(self.settings_path, asdict(self.settings))
+        self._lazy_loaders = {'images': _load_images, 'snippets': _load_snippets}
 
-        # Security data must remain plaintext (PIN verification depends on it).
-        try:
-            safe_json_save(self.security_path, getattr(self, 'security', {}))
-        except Exception:
-            pass
+    def _lazy_store(self, name: str) -> list:
+        """Return a lazily loaded list store, running its pending loader on first access."""
+        loaders = getattr(self, '_lazy_loaders', None)
+        if loaders:
+            fn = loaders.pop(name, None)
+            if fn is not None:
+                try:
+                    val = fn()
+                except Exception:
+                    val = []
+                setattr(self, '_' + name, val)
+                if name == 'images':
+                    self._bump_images()
+        return getattr(self, '_' + name, [])
+
+    def _lazy_assign(self, name: str, value):
+        loaders = getattr(self, '_lazy_loaders', None)
+        if loaders:
+            loaders.pop(name, None)
+        setattr(self, '_' + name, value)
+
+    @property
+    def images(self) -> list:
+        return self._lazy_store('images')
+
+    @images.setter
+    def images(self, value):
+        self._lazy_assign('images', value)
+        self._bump_images()
+
+    @property
+    def snippets(self) -> list:
+        return self._lazy_store('snippets')
+
+    @snippets.setter
+    def snippets(self, value):
+        self._lazy_assign('snippets', value)
+
+    # Favorites/Pins are ordered lists with a companion set for O(1) membership.
+    # Assign a new list or use _ordered_add/_ordered_discard; do not mutate the lists directly.
+    @property
+    def favorites(self) -> list:
+        return self._favorites
+
+    @favorites.setter
+    def favorites(self, value):
+        self._favorites = value
+        self._favorites_set = set(value)
+
+    @property
+    def pins(self) -> list:
+        return self._pins
+
+    @pins.setter
+    def pins(self, value):
+        self._pins = value
+        self._pins_set = set(value)
+
+    def _ordered_add(self, name: str, x: str) -> bool:
+        """Append x to the 'favorites' or 'pins' list if missing. Returns True when added."""
+        members = getattr(self, f'_{name}_set')
+        if x in members:
+            return False
+        getattr(self, f'_{name}').append(x)
+        members.add(x)
+        return True
 
-        # If Encrypt-All is enabled, never write store files unless a verified session PIN is present.
-        # This prevents overwriting encrypted JSON envelopes with plaintext defaults while locked.
-        try:
-            if self._enc_all_enabled() and not getattr(self, '_session_pin', None):
-                return
-        except Exception:
-            pass
+    def _ordered_discard(self, name: str, x: str) -> bool:
+        """Remove x from the 'favorites' or 'pins' list if present. Returns True when removed."""
+        members = getattr(self, f'_{name}_set')
+        if x not in members:
+            return False
+        getattr(self, f'_{name}').remove(x)
+        members.discard(x)
+        return True
 
-        # Advanced feature stores (encrypt-all applies here too)
-        try:
-            self._store_save_json(self.snippets_path, {'templates': getattr(self, 'snippets', [])})
-            self._store_save_json(self.images_meta_path, getattr(self, 'images', []))
+    def _rekey_item(self, old: str, new: str):
+        """Carry favorite/pin membership (in place, keeping position), tags and expiry from old to new."""
+        if old == new:
+            return
+        for name in ('favorites', 'pins'):
+            members = getattr(self, f'_{name}_set')
+            if old not in members:
+                continue
+            lst = getattr(self, f'_{name}')
+            if new in members:
+                lst.remove(old)
+            else:
+                lst[lst.index(old)] = new
+                members.add(new)
+            members.discard(old)
+        try:
+            if old in self.tags:
+                tg = self.tags.pop(old) or []
+                merged = list(dict.fromkeys(itertools.chain(self.tags.get(new, []) or [], tg)))
+                if merged:
+                    self.tags[new] = merged
+            if old in self.expiry:
+                ts = self.expiry.pop(old)
+                self.expiry.setdefault(new, ts)
         except Exception:
             pass
 
-        if self.settings.session_only:
+    # Persisted store names (see _store_table). Order matches the historical write order.
+    _STORE_NAMES = ('snippets', 'images', 'history', 'favorites', 'pins', 'tags', 'tag_colors', 'expiry', 'formats')
+    # Stores that are still written when Session-only is enabled
+    _SESSION_STORES = ('snippets', 'images')
+    # Settings dialog notebook tab by name (lowercase), as accepted by _open_settings(initial_tab=...)
+    _SETTINGS_TAB_INDEX = {'general': 0, 'hotkeys': 1, 'sync': 2, 'advanced': 3, 'help': 4}
+    # Debounce window for coalescing store writes (ms)
+    PERSIST_DEBOUNCE_MS = 500
+    # Trailing delay before repainting the preview gutter/highlights while typing (ms)
+    PREVIEW_REPAINT_MS = 150
+    # History items matched per idle step during live search
+    SEARCH_CHUNK = 1000
+    # Quiet period before re-highlighting the preview for a live search query (ms)
+    HIGHLIGHT_DEBOUNCE_MS = 80
+
+    def _store_table(self) -> dict:
+        """Map store name -> (path, callable returning the object to save)."""
+        return {
+            'snippets': (self.snippets_path, lambda: {'templates': getattr(self, 'snippets', [])}),
+            'images': (self.images_meta_path, lambda: getattr(self, 'images', [])),
+            'history': (self.history_path, lambda: list(self.history)),
+            'favorites': (self.favs_path, lambda: list(self.favorites)),
+            'pins': (self.pins_path, lambda: list(self.pins)),
+            'tags': (self.tags_path, lambda: self.tags),
+            'tag_colors': (self.tag_colors_path, lambda: getattr(self, "tag_colors", {})),
+            'expiry': (self.expiry_path, lambda: self.expiry),
+            'formats': (self.formats_path, lambda: getattr(self, 'clip_formats', {}) or {}),
+        }
+
+    def _mark_dirty(self, *names: str, now: bool = False):
+        """Mark stores as changed and schedule a single coalesced flush.
+
+        Bursts of edits (e.g. rapid clipboard captures) collapse into one write per store.
+        Use now=True to flush immediately (e.g. before a sync push).
+        """
+        dirty = getattr(self, '_dirty_stores', None)
+        if dirty is None:
+            dirty = self._dirty_stores = set()
+        dirty.update(names)
+        if 'tags' in names:
+            self._bump_tags()
+        if 'history' in names:
+            self._history_version = getattr(self, '_history_version', 0) + 1
+
+        if now:
+            self._flush_dirty()
             return
 
-        self._store_save_json(self.history_path, list(self.history))
-        self._store_save_json(self.favs_path, list(self.favorites))
-        self._store_save_json(self.pins_path, list(self.pins))
-        self._store_save_json(self.tags_path, self.tags)
-        self._store_save_json(self.tag_colors_path, getattr(self, "tag_colors", {}))
-        self._store_save_json(self.expiry_path, self.expiry)
-        # Rich clipboard formats (HTML/RTF)
+        if getattr(self, '_persist_job', None) is not None:
+            return
         try:
-            self._store_save_json(self.formats_path, getattr(self, 'clip_formats', {}) or {})
+            self._persist_job = self.after(self.PERSIST_DEBOUNCE_MS, self._flush_dirty)
         except Exception:
-            pass
+            self._persist_job = None
+            self._flush_dirty()
+
+    def _flush_dirty(self):
+        """Write only the stores marked dirty since the last flush."""
+        job = getattr(self, '_persist_job', None)
+        self._persist_job = None
+        if job is not None:
+            try:
+                self.after_cancel(job)
+            except Exception:
+                pass
+
+        dirty = getattr(self, '_dirty_stores', None) or set()
+        self._dirty_stores = set()
+        if not dirty:
+            return
+
+        # Settings are plaintext; required to know whether encryption/lock are enabled.
+        if 'settings' in dirty:
+            safe_json_save(self.settings_path, asdict(self.settings))
+
+        # Security data must remain plaintext (PIN verification depends on it).
+        if 'security' in dirty:
+            try:
+                safe_json_save(self.security_path, getattr(self, 'security', {}))
+            except Exception:
+                pass
+
+        # If Encrypt-All is enabled, never write store files unless a verified session PIN is present.
+        # This prevents overwriting encrypted JSON envelopes with plaintext defaults while locked.
+        enc_on = self._enc_all_enabled()
+        pin = getattr(self, '_session_pin', None)
+        stores = dirty - {'settings', 'security'}
+        if enc_on and not pin:
+            # Keep the marks: these stores are written by the first flush after unlock
+            self._dirty_stores |= stores
+            return
+
+        session_only = bool(self.settings.session_only)
+        unwritten = set()
+        for name, (path, getter) in self._store_table().items():
+            if name not in stores:
+                continue
+            if session_only and name not in self._SESSION_STORES:
+                unwritten.add(name)
+                continue
+            try:
+                self._store_save_json(path, getter(), enc_on, pin)
+            except Exception:
+                # Retried on the next flush
+                unwritten.add(name)
+        self._dirty_stores |= unwritten
+
+    def _persist(self):
+        """Persist settings and all stores now. When Encrypt-All is enabled, sensitive stores are encrypted."""
+        self._mark_dirty('settings', 'security', *self._STORE_NAMES, now=True)
 
 
     # -----------------------------
@@ -3055,6 +3621,10 @@ Thanks — {signature}""",
     # -----------------------------
     def _clipboard_get_text(self) -> str:
         """Best-effort read of text clipboard. Returns '' if non-text or unavailable."""
+        return self._clipboard_try_text() or ''
+
+    def _clipboard_try_text(self) -> str | None:
+        """Read the text clipboard; None when every reader failed (e.g. another process holds it)."""
         # Prefer pyperclip if present (works even when app not focused).
         try:
             if pyperclip is not None:
@@ -3069,7 +3639,7 @@ Thanks — {signature}""",
             t = self.clipboard_get()
             return t if isinstance(t, str) else ''
         except Exception:
-            return ''
+            return None
 
     def _clipboard_set_text(self, text_value: str) -> bool:
         """Best-effort set of text clipboard. Returns True on success."""
@@ -3094,10 +3664,14 @@ Thanks — {signature}""",
         """Return a payload containing text plus optional HTML/RTF clipboard formats.
 
         This is Windows-only best-effort. On non-Windows platforms, returns text only.
+        "ok" is False when the clipboard could not be read (text read failed or, on Windows,
+        OpenClipboard was refused), so the caller can try again on the next poll.
         """
-        out = {"text": "", "html": None, "rtf": None}
+        out = {"text": "", "html": None, "rtf": None, "ok": False}
         try:
-            out["text"] = self._clipboard_get_text()
+            t = self._clipboard_try_text()
+            out["text"] = t or ""
+            out["ok"] = t is not None
         except Exception:
             out["text"] = ""
 
@@ -3108,82 +3682,107 @@ Thanks — {signature}""",
             return out
 
         try:
-            user32 = ctypes.windll.user32
-            kernel32 = ctypes.windll.kernel32
+            user32 = USER32
+            kernel32 = KERNEL32
 
             CF_UNICODETEXT = 13
-            fmt_html = user32.RegisterClipboardFormatW("HTML Format")
-            fmt_rtf = user32.RegisterClipboardFormatW("Rich Text Format")
+            fmt_html, fmt_rtf = self._win_rich_formats(user32)
 
             if not user32.OpenClipboard(None):
+                out["ok"] = False
                 return out
             try:
-                # HTML
-                try:
-                    if fmt_html:
-                        h = user32.GetClipboardData(fmt_html)
-                        if h:
-                            p = kernel32.GlobalLock(h)
-                            if p:
-                                try:
-                                    sz = kernel32.GlobalSize(h)
-                                    out["html"] = ctypes.string_at(p, sz)
-                                finally:
-                                    kernel32.GlobalUnlock(h)
-                except Exception:
-                    pass
-
-                # RTF
-                try:
-                    if fmt_rtf:
-                        h = user32.GetClipboardData(fmt_rtf)
-                        if h:
-                            p = kernel32.GlobalLock(h)
-                            if p:
-                                try:
-                                    sz = kernel32.GlobalSize(h)
-                                    out["rtf"] = ctypes.string_at(p, sz)
-                                finally:
-                                    kernel32.GlobalUnlock(h)
-                except Exception:
-                    pass
+                out["html"] = self._win_get_cf(user32, kernel32, fmt_html)
+                out["rtf"] = self._win_get_cf(user32, kernel32, fmt_rtf)
 
                 # If Unicode text was not available via pyperclip/Tk (rare), attempt it here
-                try:
-                    if not out.get("text"):
-                        htxt = user32.GetClipboardData(CF_UNICODETEXT)
-                        if htxt:
-                            p = kernel32.GlobalLock(htxt)
-                            if p:
-                                try:
-                                    out["text"] = ctypes.wstring_at(p)
-                                finally:
-                                    kernel32.GlobalUnlock(htxt)
-                except Exception:
-                    pass
+                if not out.get("text"):
+                    htxt = user32.GetClipboardData(CF_UNICODETEXT)
+                    p = kernel32.GlobalLock(htxt) if htxt else None
+                    if p:
+                        try:
+                            out["text"] = ctypes.wstring_at(p)
+                        finally:
+                            kernel32.GlobalUnlock(htxt)
+                    # No CF_UNICODETEXT at all (e.g. an image copy) is a definite answer, not a failure
+                    out["ok"] = out["ok"] or bool(p) or not htxt
             finally:
                 try:
                     user32.CloseClipboard()
                 except Exception:
                     pass
         except Exception:
+            out["ok"] = False
             return out
         return out
 
-    def _clipboard_set_rich_text(self, text_value: str) -> bool:
-        """Set clipboard using the stored HTML/RTF formats for this text when available.
+    def _win_rich_formats(self, user32) -> tuple:
+        """Return the (HTML, RTF) clipboard format ids. They are global atoms, so register once."""
+        fmts = getattr(self, '_win_cf_rich', None)
+        if not fmts:
+            fmts = (user32.RegisterClipboardFormatW("HTML Format"), user32.RegisterClipboardFormatW("Rich Text Format"))
+            if all(fmts):
+                self._win_cf_rich = fmts
+        return fmts
 
-        Falls back to plain text when:
-        - not on Windows
-        - no stored formats exist for the given text
-        - clipboard API fails
-        """
-        t = text_value if isinstance(text_value, str) else str(text_value)
+    @staticmethod
+    def _win_get_cf(user32, kernel32, fmt: int):
+        """Return the raw bytes of clipboard format `fmt` (clipboard must already be open), or None."""
+        if not fmt:
+            return None
+        h = user32.GetClipboardData(fmt)
+        if not h:
+            return None
+        p = kernel32.GlobalLock(h)
+        if not p:
+            return None
         try:
-            if os.name != 'nt':
-                return self._clipboard_set_text(t)
-        except Exception:
-            return self._clipboard_set_text(t)
+            return ctypes.string_at(p, kernel32.GlobalSize(h))
+        finally:
+            kernel32.GlobalUnlock(h)
+
+    def _clip_formats_bytes(self, t: str, rec: dict):
+        """Return (html, rtf) raw bytes for a clip_formats record, decoding base64 at most once.
+
+        The decoded bytes are memoised in _clip_formats_raw alongside the b64 strings they
+        came from, so a record replaced by sync/import is re-decoded instead of served stale.
+        """
+        html_b64 = rec.get('html_b64')
+        rtf_b64 = rec.get('rtf_b64')
+        html_b64 = html_b64 if isinstance(html_b64, str) and html_b64 else None
+        rtf_b64 = rtf_b64 if isinstance(rtf_b64, str) and rtf_b64 else None
+        if html_b64 is None and rtf_b64 is None:
+            return None, None
+
+        cache = getattr(self, '_clip_formats_raw', None)
+        if not isinstance(cache, dict):
+            cache = self._clip_formats_raw = {}
+        hit = cache.get(t)
+        if hit is not None and hit[0] is html_b64 and hit[1] is rtf_b64:
+            return hit[2], hit[3]
+
+        try:
+            html = base64.b64decode(html_b64.encode('ascii')) if html_b64 else None
+            rtf = base64.b64decode(rtf_b64.encode('ascii')) if rtf_b64 else None
+        except Exception:
+            return None, None
+        cache[t] = (html_b64, rtf_b64, html, rtf)
+        return html, rtf
+
+    def _clipboard_set_rich_text(self, text_value: str) -> bool:
+        """Set clipboard using the stored HTML/RTF formats for this text when available.
+
+        Falls back to plain text when:
+        - not on Windows
+        - no stored formats exist for the given text
+        - clipboard API fails
+        """
+        t = text_value if isinstance(text_value, str) else str(text_value)
+        try:
+            if os.name != 'nt':
+                return self._clipboard_set_text(t)
+        except Exception:
+            return self._clipboard_set_text(t)
 
         rec = None
         try:
@@ -3193,29 +3792,17 @@ Thanks — {signature}""",
         if not isinstance(rec, dict):
             return self._clipboard_set_text(t)
 
-        html_b64 = rec.get('html_b64')
-        rtf_b64 = rec.get('rtf_b64')
-        want_any = bool(isinstance(html_b64, str) and html_b64) or bool(isinstance(rtf_b64, str) and rtf_b64)
-        if not want_any:
-            return self._clipboard_set_text(t)
-
-        try:
-            import base64
-            html = base64.b64decode(html_b64.encode('ascii')) if isinstance(html_b64, str) and html_b64 else None
-            rtf = base64.b64decode(rtf_b64.encode('ascii')) if isinstance(rtf_b64, str) and rtf_b64 else None
-        except Exception:
-            html = rtf = None
+        html, rtf = self._clip_formats_bytes(t, rec)
         if html is None and rtf is None:
             return self._clipboard_set_text(t)
 
         try:
-            user32 = ctypes.windll.user32
-            kernel32 = ctypes.windll.kernel32
+            user32 = USER32
+            kernel32 = KERNEL32
 
             GMEM_MOVEABLE = 0x0002
             CF_UNICODETEXT = 13
-            fmt_html = user32.RegisterClipboardFormatW("HTML Format")
-            fmt_rtf = user32.RegisterClipboardFormatW("Rich Text Format")
+            fmt_html, fmt_rtf = self._win_rich_formats(user32)
 
             if not user32.OpenClipboard(None):
                 return self._clipboard_set_text(t)
@@ -3281,11 +3868,20 @@ Thanks — {signature}""",
             self._global_hotkey_handles = []
         except Exception:
             self._global_hotkey_handles = []
+        self._global_hotkey_sig = None
 
     def _register_global_hotkeys(self):
         # Register Windows global hotkeys if enabled
+        enabled = bool(getattr(self.settings, 'enable_global_hotkeys', False))
+        hk_qp = str(getattr(self.settings, 'hotkey_quick_paste', 'ctrl+alt+v') or '').strip()
+        hk_last = str(getattr(self.settings, 'hotkey_paste_last', 'ctrl+alt+shift+v') or '').strip()
+        hk_pause = str(getattr(self.settings, 'hotkey_toggle_pause', 'ctrl+alt+p') or '').strip()
+        sig = (enabled, hk_qp, hk_last, hk_pause)
+        # Unhooking and re-hooking the keyboard library is slow; skip it when nothing changed
+        if enabled and _kbd is not None and sig == getattr(self, '_global_hotkey_sig', None):
+            return
         self._unregister_global_hotkeys()
-        if not getattr(self.settings, 'enable_global_hotkeys', False):
+        if not enabled:
             return
         if _kbd is None:
             # Do not hard fail; user can still use the app normally
@@ -3305,20 +3901,21 @@ Thanks — {signature}""",
             return _wrap
 
         handles = []
+        registered_sig = None
         try:
-            hk_qp = str(getattr(self.settings, 'hotkey_quick_paste', 'ctrl+alt+v') or '').strip()
-            hk_last = str(getattr(self.settings, 'hotkey_paste_last', 'ctrl+alt+shift+v') or '').strip()
-            hk_pause = str(getattr(self.settings, 'hotkey_toggle_pause', 'ctrl+alt+p') or '').strip()
             if hk_qp:
                 handles.append(_kbd.add_hotkey(hk_qp, safe_call(self._open_quick_paste)))
             if hk_last:
                 handles.append(_kbd.add_hotkey(hk_last, safe_call(self._paste_last_hotkey)))
             if hk_pause:
                 handles.append(_kbd.add_hotkey(hk_pause, safe_call(self._toggle_pause)))
+            registered_sig = sig
         except Exception:
+            # Leave the signature unset so the next call retries the registration
             pass
 
         self._global_hotkey_handles = handles
+        self._global_hotkey_sig = registered_sig
 
     def _paste_last_hotkey(self):
         # Copy newest history item to clipboard and paste (if possible)
@@ -3346,16 +3943,23 @@ Thanks — {signature}""",
     def _sync_enabled(self) -> bool:
         return bool(getattr(self.settings, 'sync_enabled', False)) and bool(str(getattr(self.settings, 'sync_folder', '') or '').strip())
 
+    # (local path attribute, sync filename)
+    _SYNC_FILES = (
+        ('history_path', 'history.json'),
+        ('favs_path', 'favorites.json'),
+        ('pins_path', 'pins.json'),
+        ('tags_path', 'tags.json'),
+        ('expiry_path', 'expiry.json'),
+        ('formats_path', 'formats.json'),
+    )
+
     def _sync_paths(self):
-        # local_path, filename
-        return [
-            (self.history_path, 'history.json'),
-            (self.favs_path, 'favorites.json'),
-            (self.pins_path, 'pins.json'),
-            (self.tags_path, 'tags.json'),
-            (self.expiry_path, 'expiry.json'),
-            (self.formats_path, 'formats.json'),
-        ]
+        # local_path, filename (paths are fixed for the lifetime of the app; build once)
+        cached = getattr(self, '_sync_paths_cache', None)
+        if cached is None:
+            cached = tuple((getattr(self, attr), fname) for attr, fname in self._SYNC_FILES)
+            self._sync_paths_cache = cached
+        return cached
 
     def _sync_now(self):
         if not self._sync_enabled():
@@ -3399,6 +4003,13 @@ Thanks — {signature}""",
         except Exception:
             pass
         self._sync_job = None
+        try:
+            pool = getattr(self, '_sync_pool', None)
+            self._sync_pool = None
+            if pool is not None:
+                pool.shutdown(wait=False)
+        except Exception:
+            pass
 
     def _run_sync_cycle(self, show_status: bool = False):
         if not self._sync_enabled():
@@ -3419,59 +4030,105 @@ Thanks — {signature}""",
             except Exception:
                 pass
 
+    def _sync_read_files(self, items: list) -> list:
+        """Load (path, known_digest) items via json_load_if_changed, overlapping reads on a small reused pool.
+
+        Sync folders are often network/cloud mounts where each read is latency-bound.
+        """
+        load = lambda it: json_load_if_changed(it[0], it[1])
+        if len(items) <= 1:
+            return [load(it) for it in items]
+        pool = getattr(self, '_sync_pool', None)
+        if pool is None:
+            pool = self._sync_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='copy2-sync')
+        try:
+            return list(pool.map(load, items))
+        except Exception:
+            return [load(it) for it in items]
+
     def _sync_pull(self, folder: Path) -> int:
         # Merge remote files into local if remote changed
         changed = 0
+        changed_stores = set()
         last = getattr(self, '_sync_seen_mtimes', {}) or {}
+        hashes = getattr(self, '_sync_seen_hashes', None)
+        if not isinstance(hashes, dict):
+            hashes = self._sync_seen_hashes = {}
 
+        # One directory pass instead of exists()+stat() per file
+        try:
+            with os.scandir(folder) as it:
+                entries = {e.name: e for e in it}
+        except Exception:
+            return 0
+
+        todo = []
         for local_path, fname in self._sync_paths():
-            rpath = folder / fname
-            if not rpath.exists():
+            ent = entries.get(fname)
+            if ent is None:
                 continue
+            rpath = folder / fname
             try:
-                r_mtime = rpath.stat().st_mtime
+                st = ent.stat()
             except Exception:
                 continue
+            r_mtime = st.st_mtime_ns
             if last.get(fname) is not None and r_mtime <= last.get(fname):
                 continue
-            # merge based on file type
-            try:
-                data = safe_json_load(rpath, None)
-            except Exception:
-                data = None
+            if st.st_size == 0:
+                # Empty file (sync client still writing / placeholder): nothing to merge yet
+                continue
+            todo.append((fname, rpath, r_mtime))
 
+        # Read/parse changed files concurrently; merge below stays on the Tk thread, in file order
+        # (mtime moved but identical bytes come back as data=None and are skipped like unreadable files)
+        parsed = self._sync_read_files([(rpath, hashes.get(fname)) for fname, rpath, _m in todo])
+
+        for (fname, rpath, r_mtime), (digest, data) in zip(todo, parsed):
+            # merge based on file type
             if data is None:
                 last[fname] = r_mtime
                 continue
+            hashes[fname] = digest
 
             if fname == 'history.json' and isinstance(data, list):
-                remote = [str(x) for x in data if isinstance(x, (str, int, float))]
-                local = list(self.history)
-                merged = local + [x for x in remote if x not in local]
-                self.history = deque(merged, maxlen=self.settings.max_history)
-                self._prune_preserving_favorites()
+                remote = str_items(data)
+                merged = list(self.history)
+                seen = set(merged)
+                for x in remote:
+                    if x not in seen:
+                        seen.add(x)
+                        merged.append(x)
+                cap = self.settings.max_history
+                pruned, _ok = self._prune_preserving_favorites(merged, cap)
+                self.history = deque(pruned, maxlen=cap)
                 changed += 1
+                changed_stores.add('history')
             elif fname == 'favorites.json' and isinstance(data, list):
-                remote = [str(x) for x in data if isinstance(x, (str, int, float))]
-                merged = list(dict.fromkeys(list(self.favorites) + remote))
+                remote = str_items(data)
+                merged = list(dict.fromkeys(itertools.chain(self.favorites, remote)))
                 self.favorites = merged
                 changed += 1
+                changed_stores.add('favorites')
             elif fname == 'pins.json' and isinstance(data, list):
-                remote = [str(x) for x in data if isinstance(x, (str, int, float))]
-                merged = list(dict.fromkeys(list(self.pins) + remote))
+                remote = str_items(data)
+                merged = list(dict.fromkeys(itertools.chain(self.pins, remote)))
                 self.pins = merged
                 changed += 1
+                changed_stores.add('pins')
             elif fname == 'tags.json' and isinstance(data, dict):
                 # merge tag sets per item
                 for k, v in data.items():
                     if not isinstance(k, str):
                         continue
-                    rv = [str(tg) for tg in (v or []) if isinstance(tg, (str, int, float))]
+                    rv = str_items(v) if isinstance(v, list) else []
                     cur = self.tags.get(k, [])
-                    merged = list(dict.fromkeys(cur + rv))
+                    merged = list(dict.fromkeys(itertools.chain(cur, rv)))
                     if merged:
                         self.tags[k] = merged
+                self._bump_tags()
                 changed += 1
+                changed_stores.add('tags')
             elif fname == 'expiry.json' and isinstance(data, dict):
                 for k, v in data.items():
                     if not isinstance(k, str):
@@ -3486,6 +4143,7 @@ Thanks — {signature}""",
                         # conservative: earliest expiry wins
                         self.expiry[k] = min(float(self.expiry.get(k) or ts), ts)
                 changed += 1
+                changed_stores.add('expiry')
             elif fname == 'formats.json' and isinstance(data, dict):
                 # merge stored rich formats (prefer local if present; fill missing from remote)
                 try:
@@ -3507,6 +4165,7 @@ Thanks — {signature}""",
                 except Exception:
                     pass
                 changed += 1
+                changed_stores.add('formats')
 
             last[fname] = r_mtime
 
@@ -3520,7 +4179,8 @@ Thanks — {signature}""",
             except Exception:
                 pass
             self._refresh_list(select_last=False)
-            self._persist()
+            # Write merged stores right away so the push that follows sees them.
+            self._mark_dirty(*changed_stores, now=True)
             try:
                 self._schedule_inactivity_lock()
             except Exception:
@@ -3532,20 +4192,40 @@ Thanks — {signature}""",
     def _sync_push(self, folder: Path) -> int:
         # Copy local files to remote if local newer
         pushed = 0
+        base = os.fspath(folder)
+        last = getattr(self, '_sync_seen_mtimes', None)
         for local_path, fname in self._sync_paths():
             src = local_path
-            dst = folder / fname
+            dst = os.path.join(base, fname)
             try:
-                if not src.exists():
+                # One stat per side; a missing file is just an OSError
+                try:
+                    src_st = os.stat(src)
+                except OSError:
                     continue
-                src_m = src.stat().st_mtime
-                dst_m = dst.stat().st_mtime if dst.exists() else 0
-                if src_m <= dst_m:
+                try:
+                    dst_m = os.stat(dst).st_mtime
+                except OSError:
+                    dst_m = 0
+                if src_st.st_mtime <= dst_m:
                     continue
-                tmp = dst.with_suffix(dst.suffix + '.tmp')
-                shutil.copy2(src, tmp)
-                tmp.replace(dst)
+                # Small JSON stores: plain read + write + rename beats copy2's extra opens/metadata calls.
+                # Keep the source mtime on the copy (as copy2 did) so the newer-than check stays stable.
+                tmp = dst + '.tmp'
+                with open(src, 'rb') as fh:
+                    data = fh.read()
+                with open(tmp, 'wb') as fh:
+                    fh.write(data)
+                os.utime(tmp, ns=(src_st.st_atime_ns, src_st.st_mtime_ns))
+                os.replace(tmp, dst)
                 pushed += 1
+                # Our own push is already merged locally; don't re-parse it on the next pull.
+                if isinstance(last, dict):
+                    last[fname] = src_st.st_mtime_ns
+                try:
+                    self._sync_seen_hashes[fname] = hashlib.blake2b(data, digest_size=16).digest()
+                except Exception:
+                    pass
             except Exception:
                 continue
         return pushed
@@ -3569,24 +4249,20 @@ Thanks — {signature}""",
             return items, True
 
         # Protected items: Favorites, Pins, and anything with a Tag.
-        keep = set(self.favorites) | set(self.pins)
+        keep = self._favorites_set | self._pins_set
         try:
-            keep |= {k for k in (self.tags or {}).keys() if not str(k).startswith('IMG::')}
-        except Exception:
-            pass
-        try:
-            keep |= set((self.tags or {}).keys())
+            keep.update((self.tags or {}).keys())
         except Exception:
             pass
 
-        # Remove from the front (oldest) while over capacity, skipping Favorites/Pins
-        i = 0
-        out = items[:]
-        while len(out) > capacity and i < len(out):
-            if out[i] in keep:
-                i += 1
+        # Drop the oldest unprotected items (front first) in one pass, skipping Favorites/Pins
+        excess = len(items) - capacity
+        out = []
+        for x in items:
+            if excess > 0 and x not in keep:
+                excess -= 1
                 continue
-            out.pop(i)
+            out.append(x)
 
         if len(out) <= capacity:
             return out, True
@@ -3645,7 +4321,8 @@ Thanks — {signature}""",
             except Exception:
                 pass
 
-            if not self.paused:
+            changed, seq = self._clipboard_changed() if not self.paused else (False, None)
+            if changed:
 
                 # Note: Lock is UI-only. Clipboard capture must continue while locked.
 
@@ -3659,6 +4336,10 @@ Thanks — {signature}""",
                     pass
 
                 payload = self._clipboard_get_rich_payload()
+                # Only a successful read consumes this sequence number; if another process still
+                # held the clipboard, the next tick sees it as changed and reads again.
+                if seq is not None and isinstance(payload, dict) and payload.get('ok'):
+                    self._last_clip_seq = seq
                 text = payload.get('text') if isinstance(payload, dict) else ''
                 text = text if isinstance(text, str) else ''
 
@@ -3667,17 +4348,13 @@ Thanks — {signature}""",
 
                     # Store rich clipboard formats for this text (HTML/RTF) when present
                     try:
-                        import base64
                         html = payload.get('html') if isinstance(payload, dict) else None
                         rtf = payload.get('rtf') if isinstance(payload, dict) else None
-                        rec = {}
                         # Avoid huge blobs (keeps formats.json from exploding)
-                        if isinstance(html, (bytes, bytearray)) and 1 <= len(html) <= 300_000:
-                            rec['html_b64'] = base64.b64encode(bytes(html)).decode('ascii')
-                        if isinstance(rtf, (bytes, bytearray)) and 1 <= len(rtf) <= 300_000:
-                            rec['rtf_b64'] = base64.b64encode(bytes(rtf)).decode('ascii')
-                        if rec:
-                            (getattr(self, 'clip_formats', {}) or {})[text] = rec
+                        html = bytes(html) if isinstance(html, (bytes, bytearray)) and 1 <= len(html) <= 300_000 else None
+                        rtf = bytes(rtf) if isinstance(rtf, (bytes, bytearray)) and 1 <= len(rtf) <= 300_000 else None
+                        if html is not None or rtf is not None:
+                            self._queue_clip_formats(text, html, rtf)
                     except Exception:
                         pass
 
@@ -3697,15 +4374,75 @@ Thanks — {signature}""",
 
         self._poll_job = self.after(self.settings.poll_ms, self._poll_clipboard)
 
-    def _add_history_item(self, text: str):
-        items = list(self.history)
+    def _queue_clip_formats(self, text: str, html: bytes | None, rtf: bytes | None):
+        """Hand captured HTML/RTF bytes to a background encoder; results land via _apply_clip_formats.
+
+        Keeps base64 of large rich payloads off the Tk thread.
+        """
+        q = getattr(self, '_clip_fmt_queue', None)
+        if q is None:
+            q = self._clip_fmt_queue = queue.SimpleQueue()
+
+            def worker():
+                while True:
+                    item = q.get()
+                    if item is None:
+                        return
+                    t, h, r = item
+                    try:
+                        rec = {}
+                        if h is not None:
+                            rec['html_b64'] = binascii.b2a_base64(h, newline=False).decode('ascii')
+                        if r is not None:
+                            rec['rtf_b64'] = binascii.b2a_base64(r, newline=False).decode('ascii')
+                        self.after(0, self._apply_clip_formats, t, rec, h, r)
+                    except Exception:
+                        pass
+
+            threading.Thread(target=worker, daemon=True).start()
+        q.put((text, html, rtf))
+
+    def _apply_clip_formats(self, text: str, rec: dict, html: bytes | None, rtf: bytes | None):
+        """Store an encoded clip_formats record (Tk thread)."""
+        if not rec:
+            return
+        try:
+            fmts = getattr(self, 'clip_formats', None)
+            if not isinstance(fmts, dict):
+                fmts = self.clip_formats = {}
+            fmts[text] = rec
+            # Seed the decoded-bytes cache so re-pasting this item never decodes base64
+            try:
+                self._clip_formats_raw[text] = (rec.get('html_b64'), rec.get('rtf_b64'), html, rtf)
+            except Exception:
+                pass
+            self._mark_dirty('formats')
+        except Exception:
+            pass
+
+    def _clipboard_changed(self) -> tuple[bool, int | None]:
+        """Windows: (False, seq) when the clipboard sequence number matches the last successful read.
 
-        if items and items[-1] == text:
+        Lets idle poll ticks skip the image/HTML/RTF/text reads entirely. Returns (True, seq) for a
+        new number; the caller records it in _last_clip_seq only once the read succeeded. Always
+        (True, None) elsewhere (or when the sequence number is unavailable).
+        """
+        if USER32 is None:
+            return True, None
+        try:
+            seq = int(USER32.GetClipboardSequenceNumber())
+        except Exception:
+            return True, None
+        if seq and seq == getattr(self, '_last_clip_seq', None):
+            return False, seq
+        return True, (seq or None)
+
+    def _add_history_item(self, text: str):
+        if self.history and self.history[-1] == text:
             return
 
-        # Stable de-dupe: remove previous occurrences
-        if text in items:
-            items = [x for x in items if x != text]
+        # Stable de-dupe: copy history without previous occurrences (one pass, no separate membership scan)
+        items = [x for x in self.history if x != text]
         items.append(text)
 
         cap = self.settings.max_history
@@ -3719,7 +4456,7 @@ Thanks — {signature}""",
         if not ok:
             # Favorites/Pins exceed capacity; auto-expand capacity (up to hard cap) to avoid breaking capture.
             try:
-                protected = set(self.favorites) | set(self.pins)
+                protected = self._favorites_set | self._pins_set
                 try:
                     protected |= {k for k in (self.tags or {}).keys() if not str(k).startswith('IMG::')}
                 except Exception:
@@ -3733,7 +4470,7 @@ Thanks — {signature}""",
                     if ok:
                         self.history = deque(pruned[-cap:], maxlen=cap)
                         self._refresh_list(select_last=True)
-                        self._persist()
+                        self._mark_dirty('settings', 'history')
                         return
             except Exception:
                 pass
@@ -3746,7 +4483,7 @@ Thanks — {signature}""",
         items = pruned
         self.history = deque(items, maxlen=cap)
         self._refresh_list(select_last=True)
-        self._persist()
+        self._mark_dirty('history')
 
     # -----------------------------
     # Expiry
@@ -3760,13 +4497,20 @@ Thanks — {signature}""",
                 return 0
             exp_set = set(expired)
 
-            # Remove from history
-            items = [x for x in list(self.history) if x not in exp_set]
-            self.history = deque(items, maxlen=self.settings.max_history)
-
-            # Remove from favorites/pins
-            self.favorites = [x for x in self.favorites if x not in exp_set]
-            self.pins = [x for x in self.pins if x not in exp_set]
+            # Remove from history/favorites/pins. A handful of expiries is removed in place;
+            # only rebuild the containers when many items expire at once.
+            if len(expired) <= 32:
+                for k in expired:
+                    try:
+                        self.history.remove(k)
+                    except ValueError:
+                        pass
+                    self._ordered_discard('favorites', k)
+                    self._ordered_discard('pins', k)
+            else:
+                deque_filter_inplace(self.history, lambda x: x not in exp_set)
+                self.favorites = [x for x in self.favorites if x not in exp_set]
+                self.pins = [x for x in self.pins if x not in exp_set]
 
             # Remove tags/expiry
             for k in expired:
@@ -3777,7 +4521,7 @@ Thanks — {signature}""",
                 messagebox.showinfo(APP_NAME, f"Removed {len(expired)} expired items.")
 
             self._refresh_list(select_last=False)
-            self._persist()
+            self._mark_dirty('history', 'favorites', 'pins', 'tags', 'expiry')
             try:
                 self._schedule_inactivity_lock()
             except Exception:
@@ -3789,26 +4533,36 @@ Thanks — {signature}""",
     # -----------------------------
     # List/view helpers
     # -----------------------------
-    def _format_list_item(self, item: str, display_index: int | None = None) -> str:
+    def _format_list_item(self, item: str, display_index: int | None = None, pins=None, favs=None) -> str:
         """Format a history text item for the Listbox.
 
         display_index is the 1-based ordinal in the current view (used for line-number-like numbering).
+        pins/favs default to the Favorites/Pins membership sets.
         """
-        one = re.sub(r"\s+", " ", item).strip()
+        if pins is None:
+            pins = self._pins_set
+        if favs is None:
+            favs = self._favorites_set
+        one = _WS_RE.sub(" ", item).strip()
         if len(one) > 90:
             one = one[:87] + "..."
 
         # Use emoji indicators (customizable via PIN_ICON/FAV_ICON/TAG_ICON)
-        pin_mark = PIN_ICON if item in self.pins else " "
-        fav_mark = FAV_ICON if item in self.favorites else " "
-        tag_mark = TAG_ICON if self.tags.get(item) else " "
-
-        idx = f"{display_index:>4} | " if isinstance(display_index, int) and display_index > 0 else ""
-        prefix = f"{idx}{pin_mark}{fav_mark}{tag_mark} "
-        return prefix + one
-
-    def _format_list_item_image(self, key: str, rec: dict, display_index: int | None = None) -> str:
+        return "".join((
+            f"{display_index:>4} | " if display_index else "",
+            PIN_ICON if item in pins else " ",
+            FAV_ICON if item in favs else " ",
+            TAG_ICON if self.tags.get(item) else " ",
+            " ",
+            one,
+        ))
+
+    def _format_list_item_image(self, key: str, rec: dict, display_index: int | None = None, pins=None, favs=None) -> str:
         """Format an image record for the Listbox (Images / mixed views)."""
+        if pins is None:
+            pins = self._pins_set
+        if favs is None:
+            favs = self._favorites_set
         try:
             p = str(rec.get('path') or '')
             name = os.path.basename(p) if p else '(image)'
@@ -3819,13 +4573,14 @@ Thanks — {signature}""",
         except Exception:
             label = f"{IMAGE_ICON} (image)"
 
-        pin_mark = PIN_ICON if key in self.pins else ' ' 
-        fav_mark = FAV_ICON if key in self.favorites else ' ' 
-        tag_mark = TAG_ICON if self.tags.get(key) else ' ' 
-
-        idx = f"{display_index:>4} | " if isinstance(display_index, int) and display_index > 0 else ''
-        prefix = f"{idx}{pin_mark}{fav_mark}{tag_mark} "
-        return prefix + label
+        return "".join((
+            f"{display_index:>4} | " if display_index else '',
+            PIN_ICON if key in pins else ' ',
+            FAV_ICON if key in favs else ' ',
+            TAG_ICON if self.tags.get(key) else ' ',
+            ' ',
+            label,
+        ))
 
     def _current_filter(self) -> str:
         if hasattr(self, "filter_var") and self.filter_var is not None:
@@ -3835,22 +4590,24 @@ Thanks — {signature}""",
                 return "all"
         return "all"
 
-    def _get_all_tags(self):
-        out = set()
-        try:
-            for _t, tags in (self.tags or {}).items():
-                for tg in (tags or []):
-                    if isinstance(tg, str) and tg.strip():
-                        out.add(tg.strip())
-        except Exception:
-            pass
+    def _sorted_tags(self) -> list:
+        """Sorted distinct (stripped) tag names, derived from the tag index and cached until tags change."""
+        idx = self._ensure_tag_index()
+        cached = getattr(self, '_sorted_tags_cache', None)
+        if cached is not None and cached[0] is idx:
+            return cached[1]
+        out = sorted({tg.strip() for tg in idx if isinstance(tg, str) and tg.strip()})
+        self._sorted_tags_cache = (idx, out)
         return out
 
     def _refresh_tag_filter_values(self):
         # Refresh the Tag filter dropdown (if present)
         try:
-            values = [""] + sorted(self._get_all_tags())
-            if hasattr(self, "tag_combo") and self.tag_combo is not None:
+            values = [""] + self._sorted_tags()
+            # Only push the list to Tk when the set of tags actually changed
+            combo = getattr(self, "tag_combo", None)
+            if combo is not None and (combo, values) != getattr(self, '_tag_filter_values', None):
+                self._tag_filter_values = (combo, values)
                 try:
                     self.tag_combo.configure(values=values)
                 except Exception:
@@ -3884,7 +4641,38 @@ Thanks — {signature}""",
             pass
         self._refresh_list(select_last=True)
 
-    def _refresh_list(self, select_last: bool = False):
+    def _refresh_list(self, select_last: bool = False, now: bool = False):
+        """Request a Listbox refresh. Bursts of requests coalesce into one redraw at idle time.
+
+        The most recent request's select_last wins, so a filter change after a capture keeps the
+        user's selection. Pass now=True when the caller reads view_items/listbox right after
+        (flushes any pending refresh synchronously).
+        """
+        self._refresh_select_last = bool(select_last)
+        if now:
+            self._run_pending_refresh()
+            return
+        if getattr(self, '_refresh_job', None) is not None:
+            return
+        try:
+            self._refresh_job = self.after_idle(self._run_pending_refresh)
+        except Exception:
+            self._refresh_job = None
+            self._run_pending_refresh()
+
+    def _run_pending_refresh(self):
+        job = getattr(self, '_refresh_job', None)
+        self._refresh_job = None
+        if job is not None:
+            try:
+                self.after_cancel(job)
+            except Exception:
+                pass
+        select_last = bool(getattr(self, '_refresh_select_last', False))
+        self._refresh_select_last = False
+        self._refresh_list_now(select_last=select_last)
+
+    def _refresh_list_now(self, select_last: bool = False):
         """Refresh the left Listbox according to the current filter.
 
         Supports mixed views (text + images) for Favorites / Pins / Tags, and
@@ -3915,37 +4703,34 @@ Thanks — {signature}""",
 
         f = self._current_filter()
 
-        # Build a stable global image-key map for mixed views
-        self._image_map_all = {}
-        try:
-            for i, rec in enumerate(list(getattr(self, 'images', []) or [])):
-                k = self._image_key_for_rec(rec, i)
-                if k in self._image_map_all:
-                    k = f"{k}::{i}"
-                self._image_map_all[k] = rec
-        except Exception:
-            self._image_map_all = {}
+        # Build a stable global image-key map for mixed views (rebuilt only when images changed)
+        self._ensure_image_map()
 
-        # Resolve base items for the filter
+        # Resolve base items for the filter (lookups hoisted once per refresh)
+        img_map = self._image_map_all
+        tags_map = self.tags or {}
+        pins = list(getattr(self, 'pins', []) or [])
+        pins_set = self._pins_set
+        favs_set = self._favorites_set
         items = []
         if f == 'img':
-            self._image_map = dict(self._image_map_all)
+            self._image_map = dict(img_map)
             items = list(self._image_map.keys())
-        elif f == 'fav':
-            favs = list(getattr(self, 'favorites', []) or [])
-            items = [x for x in favs if (x in self.history) or (x in self._image_map_all)]
-        elif f == 'pin':
-            pins = list(getattr(self, 'pins', []) or [])
-            items = [x for x in pins if (x in self.history) or (x in self._image_map_all)]
+        elif f in ('fav', 'pin'):
+            hist_set = set(self.history)
+            src = pins if f == 'pin' else list(getattr(self, 'favorites', []) or [])
+            items = [x for x in src if (x in hist_set) or (x in img_map)]
         elif f == 'tag':
             try:
                 tag = str(self.tag_filter_var.get()).strip()
             except Exception:
                 tag = ''
             if tag:
-                text_items = [x for x in list(self.history) if tag in self.tags.get(x, [])]
-                img_items = [k for k in self._image_map_all.keys() if tag in self.tags.get(k, [])]
-                items = text_items + img_items
+                tagged = self._ensure_tag_index().get(tag)
+                if tagged:
+                    text_items = [x for x in self.history if x in tagged]
+                    img_items = [k for k in img_map if k in tagged]
+                    items = text_items + img_items
             else:
                 items = list(self.history)
         else:
@@ -3953,8 +4738,9 @@ Thanks — {signature}""",
 
         # Pinned items float to the top for all filters except the dedicated Pin view
         try:
-            if f != 'pin':
-                pinned = [x for x in (getattr(self, 'pins', []) or []) if x in items]
+            if f != 'pin' and pins_set:
+                items_set = set(items)
+                pinned = [x for x in pins if x in items_set]
                 pinned_set = set(pinned)
                 rest = [x for x in items if x not in pinned_set]
                 items = pinned + rest
@@ -3962,29 +4748,38 @@ Thanks — {signature}""",
             pass
 
         self.view_items = items
-
-        # Render
-        self.listbox.delete(0, tk.END)
-        for idx0, item in enumerate(self.view_items):
-            if self._is_image_key(item):
-                rec = self._image_map_all.get(item, {})
-                self.listbox.insert(tk.END, self._format_list_item_image(item, rec, idx0 + 1))
+        self._view_index = None  # built on first _view_pos() lookup
+
+        # Render: build (label, colour) rows, then patch only the changed span of the Listbox
+        tag_colors = getattr(self, 'tag_colors', {}) or {}
+        fmt_text = self._format_list_item
+        fmt_img = self._format_list_item_image
+        rows = []
+        append = rows.append
+        for idx0, item in enumerate(items):
+            # Image keys are exactly the keys of img_map (all 'IMG::'-prefixed), so one lookup decides
+            rec = img_map.get(item)
+            if rec is not None:
+                label = fmt_img(item, rec, idx0 + 1, pins=pins_set, favs=favs_set)
             else:
-                self.listbox.insert(tk.END, self._format_list_item(item, idx0 + 1))
+                label = fmt_text(item, idx0 + 1, pins=pins_set, favs=favs_set)
 
-            # Apply tag color (first matching tag with a configured color)
+            # Tag color (first matching tag with a configured color)
+            col = None
             try:
-                for tg in self.tags.get(item, []):
-                    col = getattr(self, 'tag_colors', {}).get(tg)
-                    if isinstance(col, str) and col.strip():
-                        self.listbox.itemconfig(idx0, fg=col.strip())
+                for tg in tags_map.get(item, ()):
+                    c = tag_colors.get(tg)
+                    if isinstance(c, str) and c.strip():
+                        col = c.strip()
                         break
             except Exception:
                 pass
+            append((label, col))
+        self._render_list_rows(rows)
 
         # Reset selection tracking
         self._prev_sel_set = set()
-        self._sel_order = []
+        self._sel_order = {}
 
         # Restore selection
         if select_last and self.view_items:
@@ -3999,14 +4794,14 @@ Thanks — {signature}""",
                 self.listbox.selection_clear(0, tk.END)
                 restored = []
                 for t in preserve:
-                    if t in self.view_items:
-                        i = self.view_items.index(t)
-                        self.listbox.selection_set(i)
+                    i = self._view_pos(t)
+                    if i is not None:
                         restored.append(i)
+                self._select_rows(self.listbox, restored)
                 if restored:
                     self.listbox.see(restored[0])
                     self._prev_sel_set = set(restored)
-                    self._sel_order = list(restored)
+                    self._sel_order = dict.fromkeys(restored)
             except Exception:
                 pass
 
@@ -4024,16 +4819,112 @@ Thanks — {signature}""",
 
 
 
+    def _ensure_image_map(self):
+        """Rebuild _image_map_all only when the images list was replaced, grew/shrank or was bumped.
+
+        Code that edits image records in place (e.g. path changes) must call _bump_images().
+        """
+        imgs = getattr(self, 'images', None) or []
+        sig = (id(imgs), len(imgs), getattr(self, '_images_version', 0))
+        if sig == getattr(self, '_image_map_sig', None) and isinstance(getattr(self, '_image_map_all', None), dict):
+            return
+        m = {}
+        try:
+            for i, rec in enumerate(list(imgs)):
+                k = self._image_key_for_rec(rec, i)
+                if k in m:
+                    k = f"{k}::{i}"
+                m[k] = rec
+        except Exception:
+            m = {}
+        self._image_map_all = m
+        self._image_map_sig = sig
+
+    def _bump_images(self):
+        self._images_version = getattr(self, '_images_version', 0) + 1
+
+    def _bump_tags(self):
+        self._tags_version = getattr(self, '_tags_version', 0) + 1
+
+    def _ensure_tag_index(self) -> dict:
+        """Return {tag: set(item keys)}, rebuilt only when tags were replaced, resized or marked dirty.
+
+        Tag edits always go through _mark_dirty('tags'), which bumps _tags_version.
+        The same pass refreshes _tagged_keys (keys with at least one tag).
+        """
+        tags = self.tags or {}
+        sig = (id(tags), len(tags), getattr(self, '_tags_version', 0))
+        idx = getattr(self, '_tag_index', None)
+        if sig == getattr(self, '_tag_index_sig', None) and isinstance(idx, dict):
+            return idx
+        idx = {}
+        tagged = set()
+        try:
+            for k, tgs in tags.items():
+                if not tgs:
+                    continue
+                tagged.add(k)
+                for t in tgs:
+                    idx.setdefault(t, set()).add(k)
+        except Exception:
+            idx = {}
+            tagged = set()
+        self._tag_index = idx
+        self._tagged_keys = tagged
+        self._tag_index_sig = sig
+        return idx
+
+    def _get_tagged_keys(self) -> set:
+        self._ensure_tag_index()
+        return self._tagged_keys
+
+    def _render_list_rows(self, rows: list):
+        """Apply (label, colour) rows to the Listbox, touching only rows that differ from the last render.
+
+        Keeps the common prefix/suffix with the previous render and replaces the middle span,
+        so the usual "one item appended" refresh is a single insert instead of a full rebuild.
+        """
+        lb = self.listbox
+        prev = getattr(self, '_list_rows', None)
+        old = prev[1] if (prev is not None and prev[0] is lb) else None
+        try:
+            if old is not None and lb.size() != len(old):
+                old = None
+        except Exception:
+            old = None
+        if old is None:
+            old = []
+            lb.delete(0, tk.END)
+
+        n_old, n_new = len(old), len(rows)
+        lim = min(n_old, n_new)
+        pre = 0
+        while pre < lim and old[pre] == rows[pre]:
+            pre += 1
+        suf = 0
+        while suf < lim - pre and old[n_old - 1 - suf] == rows[n_new - 1 - suf]:
+            suf += 1
+
+        if n_old - suf > pre:
+            lb.delete(pre, n_old - suf - 1)
+        mid = rows[pre:n_new - suf]
+        if mid:
+            lb.insert(pre, *[label for label, _col in mid])
+            for i, (_label, col) in enumerate(mid, start=pre):
+                if col:
+                    try:
+                        lb.itemconfig(i, fg=col)
+                    except Exception:
+                        pass
+        self._list_rows = (lb, rows)
+
     def _get_selected_indices(self) -> list[int]:
         return list(self.listbox.curselection())
 
     def _is_image_key(self, key) -> bool:
-        try:
-            if not (isinstance(key, str) and key.startswith('IMG::')):
-                return False
-            return key in (getattr(self, '_image_map_all', {}) or {})
-        except Exception:
+        if not (isinstance(key, str) and key.startswith('IMG::')):
             return False
+        return key in (getattr(self, '_image_map_all', None) or ())
 
     def _get_selected_item(self):
         """Return a tuple: (kind, payload) where kind in {'text','image'}.
@@ -4069,14 +4960,46 @@ Thanks — {signature}""",
     def _get_preview_display_text_for_item(self, item_text: str) -> str:
         try:
             if getattr(self, '_reverse_item_text', None) == item_text:
-                return self._apply_reverse_lines(item_text)
+                # Memoised: the dirty check asks for this baseline on every keystroke
+                cached = getattr(self, '_reverse_display_cache', None)
+                if cached is not None and cached[0] == item_text:
+                    return cached[1]
+                display = self._apply_reverse_lines(item_text)
+                self._reverse_display_cache = (item_text, display)
+                return display
         except Exception:
             pass
         return item_text
 
+    def _preview_text(self) -> str:
+        """Preview contents without Tk's trailing newline, fetched over Tcl only after an edit marked the cache stale."""
+        if getattr(self, '_preview_cache_stale', True) or not getattr(self, '_preview_cache_bound', False):
+            self._preview_text_cache = self.preview.get("1.0", "end-1c")
+            self._preview_cache_stale = False
+        return self._preview_text_cache
+
+    def _touch_preview(self):
+        """Record a Preview content change: invalidates the text cache and bumps the revision."""
+        self._preview_cache_stale = True
+        self._preview_rev = getattr(self, '_preview_rev', 0) + 1
+
+    def _on_preview_modified(self, _event=None):
+        try:
+            if not self.preview.edit_modified():
+                return  # the event our own reset below generates
+            # Re-arm: Tk only fires <<Modified>> again once the flag is cleared
+            self.preview.edit_modified(False)
+        except Exception:
+            return
+        self._touch_preview()
+        self._preview_cache_bound = True
+        # Edits that arrive without a KeyRelease (mouse paste, menu actions) still update the dirty state
+        self._mark_preview_dirty()
+
     def _set_preview_text(self, text: str, mark_clean: bool = True):
         self.preview.delete("1.0", tk.END)
         self.preview.insert("1.0", text)
+        self._touch_preview()
         self._preview_dirty = not mark_clean
         self._update_preview_dirty_ui()
 
@@ -4168,10 +5091,6 @@ Thanks — {signature}""",
         # Load & scale the image to the available preview area
         try:
             import io
-            b = self._load_image_bytes(rec)
-            if b is None:
-                raise RuntimeError("no image bytes")
-            img = Image.open(io.BytesIO(b))
             # Determine target size
             self.preview_container.update_idletasks()
             w = int(self.preview_container.winfo_width() or 800)
@@ -4179,8 +5098,32 @@ Thanks — {signature}""",
             # Leave room for title + padding
             h = max(100, h - 60)
             w = max(100, w - 40)
-            img.thumbnail((w, h))
-            self._img_preview_tk = ImageTk.PhotoImage(img)
+
+            # Reuse scaled previews (and the last decoded source) for unchanged files
+            st = os.stat(path)
+            src_key = (path, st.st_mtime_ns, st.st_size)
+            cache = getattr(self, '_img_preview_cache', None)
+            if cache is None:
+                cache = self._img_preview_cache = {}
+            photo = cache.pop(src_key + (w, h), None)
+            if photo is None:
+                src = getattr(self, '_img_preview_src', None)
+                if src is not None and src[0] == src_key:
+                    img = src[1]
+                else:
+                    b = self._load_image_bytes(rec)
+                    if b is None:
+                        raise RuntimeError("no image bytes")
+                    img = Image.open(io.BytesIO(b))
+                    img.load()
+                    self._img_preview_src = (src_key, img)
+                thumb = img.copy()
+                thumb.thumbnail((w, h))
+                photo = ImageTk.PhotoImage(thumb)
+                while len(cache) >= 8:
+                    cache.pop(next(iter(cache)))
+            cache[src_key + (w, h)] = photo
+            self._img_preview_tk = photo
             self.image_preview_label.configure(image=self._img_preview_tk, text='')
         except Exception:
             try:
@@ -4234,13 +5177,39 @@ Thanks — {signature}""",
         if self.search_query:
             self._highlight_query_in_preview(self.search_query)
 
+    @staticmethod
+    def _select_rows(lb, rows):
+        """selection_set() each contiguous run of rows as one (first, last) range call."""
+        run_start = prev = None
+        for i in sorted(set(rows)):
+            if prev is not None and i == prev + 1:
+                prev = i
+                continue
+            if run_start is not None:
+                lb.selection_set(run_start, prev)
+            run_start = prev = i
+        if run_start is not None:
+            lb.selection_set(run_start, prev)
+
+    def _view_pos(self, item) -> int | None:
+        """Row of item in view_items (first occurrence), via a dict built once per refresh."""
+        idx = getattr(self, '_view_index', None)
+        items = self.view_items
+        if idx is None or getattr(self, '_view_index_src', None) is not items:
+            idx = {}
+            for i, t in enumerate(items):
+                idx.setdefault(t, i)
+            self._view_index = idx
+            self._view_index_src = items
+        return idx.get(item)
+
     def _reselect_current_item(self):
         if not self._selected_item_text:
             return
         try:
-            if self._selected_item_text not in self.view_items:
+            idx = self._view_pos(self._selected_item_text)
+            if idx is None:
                 return
-            idx = self.view_items.index(self._selected_item_text)
             self.listbox.selection_clear(0, tk.END)
             self.listbox.selection_set(idx)
             self.listbox.see(idx)
@@ -4251,28 +5220,27 @@ Thanks — {signature}""",
     # Selection order tracking for Combine
     # -----------------------------
     def _on_listbox_select_event(self, _event=None):
-        current = set(self.listbox.curselection())
-
-        added = current - self._prev_sel_set
-        removed = self._prev_sel_set - current
-
-        if removed:
-            self._sel_order = [i for i in self._sel_order if i not in removed]
-
-        if added:
-            for i in sorted(list(added)):
-                if i not in self._sel_order:
-                    self._sel_order.append(i)
-
-        self._prev_sel_set = current
-
-        # Cache selected texts so refreshes after button actions can restore selection
-        try:
-            self._last_selected_texts = [self.view_items[i] for i in sorted(current) if 0 <= i < len(self.view_items)]
-        except Exception:
-            self._last_selected_texts = []
-
-        if len(current) == 1:
+        sel = self.listbox.curselection()  # already ascending
+        prev = self._prev_sel_set
+        if len(sel) != len(prev) or not prev.issuperset(sel):
+            current = set(sel)
+            order = self._sel_order
+            for i in prev - current:
+                order.pop(i, None)
+            for i in sel:
+                if i not in prev:
+                    order[i] = None
+            self._prev_sel_set = current
+
+            # Cache selected texts so refreshes after button actions can restore selection
+            try:
+                view = self.view_items
+                n = len(view)
+                self._last_selected_texts = [view[i] for i in sel if 0 <= i < n]
+            except Exception:
+                self._last_selected_texts = []
+
+        if len(sel) == 1:
             self._on_select()
 
     # -----------------------------
@@ -4331,14 +5299,28 @@ Thanks — {signature}""",
                 pass
 
     def _mark_preview_dirty(self, _event=None):
-        if self._selected_item_text is None and self.preview.get("1.0", tk.END).strip():
+        if self._selected_item_text is None and self._preview_text().strip():
             self._preview_dirty = True
         elif self._selected_item_text is not None:
             baseline = self._get_preview_display_text_for_item(self._selected_item_text)
-            current = self.preview.get("1.0", tk.END).rstrip("\n")
+            current = self._preview_text().rstrip("\n")
             self._preview_dirty = (current != baseline)
         self._update_preview_dirty_ui()
 
+        # Line numbers and search highlights walk the whole widget: repaint once typing pauses
+        job = getattr(self, '_preview_repaint_job', None)
+        if job is not None:
+            try:
+                self.after_cancel(job)
+            except Exception:
+                pass
+        try:
+            self._preview_repaint_job = self.after(self.PREVIEW_REPAINT_MS, self._repaint_preview_extras)
+        except Exception:
+            self._repaint_preview_extras()
+
+    def _repaint_preview_extras(self):
+        self._preview_repaint_job = None
         # Keep line numbers up to date while editing
         try:
             self._update_preview_line_numbers()
@@ -4349,7 +5331,7 @@ Thanks — {signature}""",
             self._highlight_query_in_preview(self.search_query)
 
     def _save_preview_edits(self, _event=None):
-        text_now = self.preview.get("1.0", tk.END).rstrip("\n")
+        text_now = self._preview_text().rstrip("\n")
 
         if self._selected_item_text is None:
             if text_now.strip():
@@ -4377,24 +5359,27 @@ Thanks — {signature}""",
             messagebox.showwarning(APP_NAME, "Cannot save an empty item.")
             return
 
-        items = [x for x in self.history if x != old]
-        items.append(new)
-
-        # favorites map update
-        if old in self.favorites:
-            self.favorites = [new if x == old else x for x in self.favorites]
-
-        # prune if needed (preserve favorites)
         cap = self.settings.max_history
-        pruned, ok = self._prune_preserving_favorites(items, cap)
-        if not ok:
-            self._notify_favorites_blocking()
-            return
+        hist = self.history
+        if hist.maxlen == cap and (len(hist) < cap or (len(hist) == cap and old in hist)):
+            # Usual case: the edit replaces an item, so there is room to append in place (no pruning)
+            deque_filter_inplace(hist, lambda x: x != old and x != new)
+            hist.append(new)
+        else:
+            items = [x for x in hist if x != old and x != new]
+            items.append(new)
 
-        self.history = deque(pruned, maxlen=cap)
+            # prune if needed (preserve favorites)
+            pruned, ok = self._prune_preserving_favorites(items, cap)
+            if not ok:
+                self._notify_favorites_blocking()
+                return
+
+            self.history = deque(pruned, maxlen=cap)
+        self._rekey_item(old, new)
         self._selected_item_text = new
         self._preview_dirty = False
-        self._persist()
+        self._mark_dirty('history', 'favorites', 'pins', 'tags', 'expiry')
         self._refresh_list(select_last=True)
         self.status_var.set(f"Saved edits — {now_ts()}")
 
@@ -4434,9 +5419,9 @@ Thanks — {signature}""",
                         except Exception:
                             pass
                         return
-                out = self.preview.get("1.0", tk.END)
+                out = self._preview_text()
         except Exception:
-            out = self.preview.get("1.0", tk.END)
+            out = self._preview_text()
 
         out = (out or '').rstrip("\n")
         if not out.strip():
@@ -4464,10 +5449,8 @@ Thanks — {signature}""",
 
             key = self._image_key_for_rec(rec)
             try:
-                if key in self.favorites:
-                    self.favorites = [x for x in self.favorites if x != key]
-                if key in self.pins:
-                    self.pins = [x for x in self.pins if x != key]
+                self._ordered_discard('favorites', key)
+                self._ordered_discard('pins', key)
                 self.tags.pop(key, None)
                 self.expiry.pop(key, None)
             except Exception:
@@ -4478,11 +5461,7 @@ Thanks — {signature}""",
                 self._save_images_meta()
             except Exception:
                 pass
-            try:
-                if path and os.path.exists(path):
-                    os.remove(path)
-            except Exception:
-                pass
+            self._unlink_files_async([path])
 
             try:
                 if hasattr(self, 'filter_var') and str(self.filter_var.get()) == 'img':
@@ -4495,14 +5474,15 @@ Thanks — {signature}""",
         if not t:
             return
 
-        items = [x for x in self.history if x != t]
-        self.history = deque(items, maxlen=self.settings.max_history)
-
-        if t in self.favorites:
-            self.favorites = [x for x in self.favorites if x != t]
+        # Remove in place (C-level scan) instead of rebuilding the whole deque
+        try:
+            while True:
+                self.history.remove(t)
+        except ValueError:
+            pass
 
-        if t in self.pins:
-            self.pins = [x for x in self.pins if x != t]
+        self._ordered_discard('favorites', t)
+        self._ordered_discard('pins', t)
 
         self.tags.pop(t, None)
         self.expiry.pop(t, None)
@@ -4512,7 +5492,22 @@ Thanks — {signature}""",
             self._set_preview_text("", mark_clean=True)
 
         self._refresh_list(select_last=True)
-        self._persist()
+        self._mark_dirty('history', 'favorites', 'pins', 'tags', 'expiry')
+
+    def _unlink_files_async(self, paths: list):
+        """Delete files on a daemon thread (best-effort); metadata is already saved without them."""
+        paths = [p for p in paths if p]
+        if not paths:
+            return
+
+        def worker():
+            for p in paths:
+                try:
+                    os.remove(p)
+                except Exception:
+                    pass
+
+        threading.Thread(target=worker, daemon=True).start()
 
     def _clean_keep_favorites(self):
         """Clean action.
@@ -4525,29 +5520,28 @@ Thanks — {signature}""",
             return
 
         # Protected keys: favorites, pins, and any key that has at least one tag.
-        keep = set(self.favorites) | set(self.pins)
-        try:
-            keep |= {k for k, v in (self.tags or {}).items() if isinstance(v, list) and len(v) > 0}
-        except Exception:
-            pass
+        keep = self._favorites_set | self._pins_set | self._get_tagged_keys()
 
         # Text history: keep only protected items (favorites/pins/tagged)
-        kept = [x for x in self.history if x in keep]
-        self.history = deque(kept, maxlen=self.settings.max_history)
+        deque_filter_inplace(self.history, keep.__contains__)
 
         # Images: keep only protected; remove files + metadata + tag/expiry refs for removed images
         try:
             new_images = []
-            for i, rec in enumerate(list(getattr(self, 'images', []) or [])):
-                k = self._image_key_for_rec(rec, i)
+            to_unlink = []
+            # Keys come from the cached image map (same keys the list/favorites use), not recomputed per record
+            self._ensure_image_map()
+            imgs = getattr(self, 'images', None) or []
+            pairs = self._image_map_all.items()
+            if len(self._image_map_all) != len(imgs):
+                pairs = ((self._image_key_for_rec(rec, i), rec) for i, rec in enumerate(imgs))
+            for k, rec in pairs:
                 if k in keep:
                     new_images.append(rec)
                 else:
-                    # Remove file on disk
+                    # File removal is batched off the UI thread below
                     try:
-                        p = str(rec.get('path') or '').strip()
-                        if p and os.path.exists(p):
-                            os.remove(p)
+                        to_unlink.append(str(rec.get('path') or '').strip())
                     except Exception:
                         pass
                     # Remove metadata pointers for removed item only
@@ -4557,15 +5551,14 @@ Thanks — {signature}""",
                     except Exception:
                         pass
                     try:
-                        if k in self.favorites:
-                            self.favorites = [x for x in self.favorites if x != k]
-                        if k in self.pins:
-                            self.pins = [x for x in self.pins if x != k]
+                        self._ordered_discard('favorites', k)
+                        self._ordered_discard('pins', k)
                     except Exception:
                         pass
 
             self.images = new_images
             self._save_images_meta()
+            self._unlink_files_async(to_unlink)
         except Exception:
             pass
 
@@ -4584,7 +5577,7 @@ Thanks — {signature}""",
         self._selected_item_text = None
         self._set_preview_text("", mark_clean=True)
         self._refresh_list(select_last=True)
-        self._persist()
+        self._mark_dirty('history', 'favorites', 'pins', 'tags', 'expiry')
         self.status_var.set(f"Cleaned (kept favorites/pins/tagged) — {now_ts()}")
 
     def _toggle_favorite_selected(self):
@@ -4595,17 +5588,16 @@ Thanks — {signature}""",
         if not items:
             return
 
-        any_unfav = any(it not in self.favorites for it in items)
+        any_unfav = any(it not in self._favorites_set for it in items)
         if any_unfav:
             for it in items:
-                if it not in self.favorites:
-                    self.favorites.append(it)
+                self._ordered_add('favorites', it)
         else:
             remove_set = set(items)
             self.favorites = [x for x in self.favorites if x not in remove_set]
 
         self._refresh_list()
-        self._persist()
+        self._mark_dirty('favorites')
 
 
     def _toggle_pin_selected(self):
@@ -4618,16 +5610,16 @@ Thanks — {signature}""",
             return
 
         # If any item is not pinned -> pin all; else unpin all
-        any_unpinned = any(t not in self.pins for t in texts)
+        any_unpinned = any(t not in self._pins_set for t in texts)
         if any_unpinned:
             for t in texts:
-                if t not in self.pins:
-                    self.pins.append(t)
+                self._ordered_add('pins', t)
         else:
-            self.pins = [x for x in self.pins if x not in set(texts)]
+            remove_set = set(texts)
+            self.pins = [x for x in self.pins if x not in remove_set]
 
         self._refresh_list()
-        self._persist()
+        self._mark_dirty('pins')
 
     def _open_tags_dialog(self):
         sel = self._get_selected_indices()
@@ -4645,7 +5637,7 @@ Thanks — {signature}""",
 
         tk.Label(dlg, text=f'Selected items: {len(texts)}', font=('Segoe UI', 10, 'bold')).pack(anchor='w', padx=12, pady=(12,6))
 
-        # Current tags (intersection)
+        # Current tags (intersection); kept up to date incrementally by add/remove below
         current_sets = []
         for t in texts:
             current_sets.append(set(self.tags.get(t, [])))
@@ -4665,21 +5657,20 @@ Thanks — {signature}""",
         ent.grid(row=1, column=0, sticky='ew', pady=(0,8))
         ent.focus_set()
 
-        all_tags = sorted({tag for tags in self.tags.values() for tag in tags})
+        all_tags = list(self._sorted_tags())  # mirrors the listbox rows
         tk.Label(frm, text='Existing tags:').grid(row=2, column=0, sticky='w')
         lb = tk.Listbox(frm, height=8, exportselection=False)
         lb.grid(row=3, column=0, sticky='nsew')
         frm.rowconfigure(3, weight=1)
-        for tg in all_tags:
-            lb.insert(tk.END, tg)
+        if all_tags:
+            lb.insert(tk.END, *all_tags)
 
         def _apply_tag_color_styling():
             """Colorize tags in the tag list based on configured tag colors."""
             try:
-                lb_end = lb.size()
-                for i in range(lb_end):
-                    tg = lb.get(i)
-                    col = getattr(self, 'tag_colors', {}).get(tg)
+                get_color = (getattr(self, 'tag_colors', {}) or {}).get
+                for i, tg in enumerate(all_tags):
+                    col = get_color(tg)
                     if isinstance(col, str) and col.strip():
                         try:
                             lb.itemconfig(i, fg=col.strip())
@@ -4715,18 +5706,18 @@ Thanks — {signature}""",
                 if tg not in cur:
                     cur = cur + [tg]
                     self.tags[t] = cur
+            self._mark_dirty('tags')
             self._refresh_tag_filter_values()
             self._refresh_list()
-            self._persist()
             try:
                 self._schedule_inactivity_lock()
             except Exception:
                 pass
-            # refresh displayed common tags
-            sets = [set(self.tags.get(t, [])) for t in texts]
-            com = set.intersection(*sets) if sets else set()
-            common_var.set(', '.join(sorted(com)) if com else '(none)')
+            # refresh displayed common tags: every selected item now carries tg
+            common.add(tg)
+            common_var.set(', '.join(sorted(common)))
             if tg not in all_tags:
+                all_tags.append(tg)
                 lb.insert(tk.END, tg)
 
         def remove_tag():
@@ -4746,16 +5737,15 @@ Thanks — {signature}""",
                     self.tags[t] = cur
                 else:
                     self.tags.pop(t, None)
+            self._mark_dirty('tags')
             self._refresh_tag_filter_values()
             self._refresh_list()
-            self._persist()
             try:
                 self._schedule_inactivity_lock()
             except Exception:
                 pass
-            sets = [set(self.tags.get(t, [])) for t in texts]
-            com = set.intersection(*sets) if sets else set()
-            common_var.set(', '.join(sorted(com)) if com else '(none)')
+            common.discard(tg)
+            common_var.set(', '.join(sorted(common)) if common else '(none)')
 
 
         def set_tag_color():
@@ -4775,7 +5765,7 @@ Thanks — {signature}""",
                 if not picked or not picked[1]:
                     return
                 self.tag_colors[tg] = picked[1]
-                self._persist()
+                self._mark_dirty('tag_colors')
                 _apply_tag_color_styling()
                 self._refresh_list()
                 try:
@@ -4798,7 +5788,7 @@ Thanks — {signature}""",
                 return
             try:
                 self.tag_colors.pop(tg, None)
-                self._persist()
+                self._mark_dirty('tag_colors')
                 _apply_tag_color_styling()
                 self._refresh_list()
                 try:
@@ -4829,7 +5819,7 @@ Thanks — {signature}""",
         for t in texts:
             self.expiry[t] = ts
 
-        self._persist()
+        self._mark_dirty('expiry')
         self.status_var.set(f'Expiry set ({mins} min) — {now_ts()}')
 
     def _clear_expiry_selected(self):
@@ -4841,7 +5831,7 @@ Thanks — {signature}""",
             return
         for t in texts:
             self.expiry.pop(t, None)
-        self._persist()
+        self._mark_dirty('expiry')
         self.status_var.set(f'Expiry cleared — {now_ts()}')
 
     def _paste_last(self, do_type: bool = False):
@@ -4919,41 +5909,70 @@ Thanks — {signature}""",
         # Build list
         def get_items():
             items = list(self.history)
-            pins = [x for x in items if x in self.pins]
-            rest = [x for x in items if x not in self.pins]
+            pins_set = self._pins_set
+            pins = [x for x in items if x in pins_set]
+            rest = [x for x in items if x not in pins_set]
             return pins + rest
 
-        base = get_items()
+        # Newest first; lowercase copies and row labels are computed once per window, not per keystroke
+        base = get_items()[::-1]
+        # One NUL-joined lowercase buffer + start offsets: each query is a run of C-level find()s
+        base_lower = [t.lower() for t in base]
+        base_buf = '\x00'.join(base_lower)
+        base_starts = list(itertools.accumulate((len(t) + 1 for t in base_lower), initial=0))
+        labels = {}
+        shown = []  # listbox row -> item text
+        pending = [None]
+
+        def matching(term: str, limit: int = 250) -> list:
+            if not term:
+                return list(range(min(limit, len(base))))
+            hits = []
+            pos = 0
+            while len(hits) < limit:
+                pos = base_buf.find(term, pos)
+                if pos < 0:
+                    break
+                k = bisect.bisect_right(base_starts, pos) - 1
+                hits.append(k)
+                pos = base_starts[k + 1]
+            return hits
 
         def refresh():
-            term = q.get().strip().lower()
+            pending[0] = None
+            term = q.get().strip().lower().replace('\x00', '')
             lb.delete(0, tk.END)
-            shown = 0
-            for t in reversed(base):
-                if term and term not in t.lower():
-                    continue
-                lb.insert(tk.END, self._format_list_item(t))
-                shown += 1
-                if shown >= 250:
-                    break
-            if shown:
+            shown.clear()
+            rows = []
+            for k in matching(term):
+                t = base[k]
+                label = labels.get(t)
+                if label is None:
+                    label = labels[t] = self._format_list_item(t)
+                shown.append(t)
+                rows.append(label)
+            if rows:
+                lb.insert(tk.END, *rows)
                 lb.selection_set(0)
 
+        def schedule_refresh(_e=None):
+            if pending[0] is not None:
+                try:
+                    win.after_cancel(pending[0])
+                except Exception:
+                    pass
+            try:
+                pending[0] = win.after(60, refresh)
+            except Exception:
+                refresh()
+
         def selected_text():
             try:
+                if pending[0] is not None:
+                    refresh()
                 idx = lb.curselection()
                 if not idx:
                     return None
-                # map back to original item by stripping prefix match against base
-                # simpler: rebuild displayed list mapping
-                term = q.get().strip().lower()
-                shown = []
-                for t in reversed(base):
-                    if term and term not in t.lower():
-                        continue
-                    shown.append(t)
-                    if len(shown) >= 250:
-                        break
                 return shown[idx[0]] if 0 <= idx[0] < len(shown) else None
             except Exception:
                 return None
@@ -4985,7 +6004,7 @@ Thanks — {signature}""",
             except Exception:
                 later()
 
-        ent.bind('<KeyRelease>', lambda e: refresh())
+        ent.bind('<KeyRelease>', schedule_refresh)
         lb.bind('<Return>', lambda e: (commit(), 'break'))
         lb.bind('<Double-Button-1>', lambda e: (commit(), 'break'))
         ent.bind('<Return>', lambda e: (commit(), 'break'))
@@ -4999,7 +6018,8 @@ Thanks — {signature}""",
         if not sel:
             return
 
-        ordered = [i for i in self._sel_order if i in sel]
+        sel_set = set(sel)
+        ordered = [i for i in self._sel_order if i in sel_set]
         if not ordered:
             ordered = sel
 
@@ -5027,53 +6047,75 @@ Thanks — {signature}""",
         - True if q is a substring of text (case-insensitive)
         - Or if the characters of q appear in-order within text
         """
-        q = (q or "").strip().lower()
+        return self._fuzzy_match_lower((q or "").strip().lower(), (text or "").lower())
+
+    def _fuzzy_match_lower(self, q: str, t: str) -> bool:
+        """_fuzzy_match for an already stripped/lowercased query and lowercased text."""
         if not q:
             return True
-        t = (text or "").lower()
         if q in t:
             return True
-        # subsequence match
-        pos = 0
-        for ch in q:
-            pos = t.find(ch, pos)
-            if pos == -1:
-                return False
-            pos += 1
-        return True
+        return self._fuzzy_pattern(q).match(t) is not None
+
+    def _fuzzy_pattern(self, q: str):
+        """Subsequence matcher for a lowercased query, compiled once per query."""
+        cache = self._fuzzy_re_cache
+        pat = cache.get(q)
+        if pat is None:
+            if len(cache) > 64:
+                cache.clear()
+            # "[^c]*c" per char: leftmost-greedy like the old find() loop, with no ambiguous backtracking
+            pat = cache[q] = re.compile(''.join(f'[^{re.escape(c)}]*{re.escape(c)}' for c in q))
+        return pat
 
     def _highlight_query_in_preview(self, query: str):
         """Highlight ALL matches of query in the preview (case-insensitive)."""
+        query = (query or "").strip()
+        # Same query over an unchanged Preview: the existing tags are already right
+        state = (query, getattr(self, '_preview_rev', 0))
+        if query and state == getattr(self, '_highlight_state', None):
+            return
+        self._highlight_state = None
         try:
             self.preview.tag_remove("match", "1.0", tk.END)
         except Exception:
             return
 
-        query = (query or "").strip()
         if not query:
             return
 
-        text = self.preview.get("1.0", tk.END)
-        if not text:
-            return
-
         try:
             self.preview.tag_config("match", background="#2b78ff", foreground="white")
         except Exception:
             pass
 
-        pattern = re.compile(re.escape(query), re.IGNORECASE)
-        first = None
-        for m in pattern.finditer(text):
-            start_index = f"1.0+{m.start()}c"
-            end_index = f"1.0+{m.end()}c"
-            self.preview.tag_add("match", start_index, end_index)
-            if first is None:
-                first = start_index
-
-        if first is not None:
-            try:
-                self.preview.see(first)
+        # Let Tk find every match itself ('search -all'): no copy of the text into Python,
+        # and it returns line.col starts plus lengths directly.
+        ranges = []
+        try:
+            w = self.preview
+            count_var = f"{w._w}_matchcount"
+            starts = w.tk.splitlist(w.tk.call(w._w, 'search', '-all', '-nocase', '-count', count_var,
+                                              '--', query, '1.0', 'end-1c'))
+            if starts:
+                raw = w.tk.globalgetvar(count_var)
+                counts = raw if isinstance(raw, tuple) else w.tk.splitlist(str(raw))
+                for st, n in zip(starts, counts):
+                    st = str(st)
+                    ranges.append(st)
+                    ranges.append(f"{st}+{n}c")
+        except Exception:
+            ranges = []
+            text = self._preview_text()
+            for m in re.finditer(re.escape(query), text, re.IGNORECASE):
+                ranges.append(f"1.0+{m.start()}c")
+                ranges.append(f"1.0+{m.end()}c")
+
+        self._highlight_state = state
+        if ranges:
+            self.preview.tag_add("match", *ranges)
+            try:
+                self.preview.see(ranges[0])
             except Exception:
                 pass
 
@@ -5089,35 +6131,25 @@ Thanks — {signature}""",
         # Returns (new_text, removed_count).
         if not isinstance(text, str) or not text:
             return (text or ""), 0
-        removed = 0
-        out: list[str] = []
-        for ch in text:
-            o = ord(ch)
-            if ch == "\u00A0":
-                out.append(' ')
-                removed += 1
-                continue
-            if ch in ("\u200B", "\u200C", "\u200D", "\uFEFF"):
-                removed += 1
-                continue
-            if o < 32 and ch not in ('\n','\t','\r'):
-                removed += 1
-                continue
-            out.append(ch)
-        return ''.join(out), removed
+        if text.isascii():
+            new_text = text.translate(_INVIS_TABLE)
+            return new_text, len(text) - len(new_text)
+        # Dropped chars shorten the text; NBSP -> space keeps the length, so count those separately
+        nbsp = text.count("\u00A0")
+        new_text = _INVIS_RE.sub("", text)
+        removed = len(text) - len(new_text) + nbsp
+        if nbsp:
+            new_text = new_text.replace("\u00A0", " ")
+        return new_text, removed
 
     def _remove_blank_lines(self, text: str) -> tuple[str, int]:
         # Removes blank/whitespace-only lines. Returns (new_text, removed_lines).
         if not isinstance(text, str) or not text:
             return (text or ""), 0
         lines = text.splitlines()
-        kept: list[str] = []
-        removed = 0
-        for ln in lines:
-            if ln.strip() == "":
-                removed += 1
-            else:
-                kept.append(ln)
+        # filter(str.strip, ...) keeps lines with any non-whitespace, without a Python-level loop
+        kept = list(filter(str.strip, lines))
+        removed = len(lines) - len(kept)
         new_text = '\n'.join(kept)
         if text.endswith('\n') and new_text and not new_text.endswith('\n'):
             new_text += '\n'
@@ -5128,7 +6160,7 @@ Thanks — {signature}""",
         if not isinstance(text, str) or not text:
             return (text or ""), 0
         # Only collapse regular spaces (not tabs). Keep line structure.
-        new_text = re.sub(r" {2,}", " ", text)
+        new_text = _MULTI_SPACE_RE.sub(" ", text)
         removed = max(0, len(text) - len(new_text))
         return new_text, removed
 
@@ -5136,74 +6168,61 @@ Thanks — {signature}""",
         """Trim leading/trailing whitespace on each line. Returns (new_text, removed_chars)."""
         if not isinstance(text, str) or not text:
             return (text or ""), 0
-        lines = text.splitlines(True)  # keep line endings
-        out: list[str] = []
-        removed = 0
-        for ln in lines:
-            # Separate newline to preserve exact endings
-            if ln.endswith("\r\n"):
-                body, nl = ln[:-2], "\r\n"
-            elif ln.endswith("\n"):
-                body, nl = ln[:-1], "\n"
-            elif ln.endswith("\r"):
-                body, nl = ln[:-1], "\r"
-            else:
-                body, nl = ln, ""
-            trimmed = body.strip(" \t")
-            removed += (len(body) - len(trimmed))
-            out.append(trimmed + nl)
-        return "".join(out), removed
+        # Line endings are left exactly as they were (lookarounds only)
+        new_text = _TRAIL_WS_RE.sub("", _LEAD_WS_RE.sub("", text))
+        return new_text, len(text) - len(new_text)
 
     def _strip_trailing_whitespace(self, text: str) -> tuple[str, int]:
         """Remove trailing spaces/tabs at end of each line. Returns (new_text, removed_chars)."""
         if not isinstance(text, str) or not text:
             return (text or ""), 0
-        lines = text.splitlines(True)
-        out: list[str] = []
-        removed = 0
-        for ln in lines:
-            # Preserve newline sequence
-            if ln.endswith("\r\n"):
-                body, nl = ln[:-2], "\r\n"
-            elif ln.endswith("\n"):
-                body, nl = ln[:-1], "\n"
-            elif ln.endswith("\r"):
-                body, nl = ln[:-1], "\r"
-            else:
-                body, nl = ln, ""
-            stripped = body.rstrip(" \t")
-            removed += (len(body) - len(stripped))
-            out.append(stripped + nl)
-        return "".join(out), removed
+        new_text = _TRAIL_WS_RE.sub("", text)
+        return new_text, len(text) - len(new_text)
 
     def _normalize_line_endings(self, text: str) -> tuple[str, int]:
         """Normalize CRLF/CR to LF. Returns (new_text, removed_cr_count)."""
         if not isinstance(text, str) or not text:
             return (text or ""), 0
         removed = text.count("\r")
-        # Convert CRLF and CR to LF
-        new_text = text.replace("\r\n", "\n").replace("\r", "\n")
+        if not removed:
+            return text, 0
+        # Convert CRLF and CR to LF (str.replace beats a regex sub here; the second pass is skipped without lone CRs)
+        new_text = text.replace("\r\n", "\n")
+        if "\r" in new_text:
+            new_text = new_text.replace("\r", "\n")
         return new_text, removed
 
     def _apply_preview_text_change(self, new_text: str, status_note: str):
         """Apply a text change to the Preview editor and report via status bar."""
         try:
-            self.preview.delete('1.0', tk.END)
-            self.preview.insert('1.0', new_text)
-            self._preview_dirty = True
-            self._update_preview_dirty_ui()
+            old_text = self._preview_text()
+            if new_text != old_text:
+                # Only rewrite the span between the unchanged head and tail: keeps Tk's relayout and the
+                # undo entry proportional to the edit. Tk counts astral chars differently, so those
+                # texts take the full replace.
+                if old_text and max(old_text) <= '\uffff' and max(new_text or ' ') <= '\uffff':
+                    head, tail = common_affix_lengths(old_text, new_text)
+                    self.preview.edit_separator()
+                    self.preview.replace(f"1.0+{head}c", f"1.0+{len(old_text) - tail}c", new_text[head:len(new_text) - tail])
+                    self.preview.edit_separator()
+                else:
+                    self.preview.delete('1.0', tk.END)
+                    self.preview.insert('1.0', new_text)
+                self._touch_preview()
+                self._preview_dirty = True
+                self._update_preview_dirty_ui()
 
-            # Apply theme colors to tk widgets and initialize status bar
-            try:
-                self._apply_theme_to_tk_widgets()
-            except Exception:
-                pass
-            try:
-                self._update_status_bar()
-            except Exception:
-                pass
-            if self.search_query:
-                self._highlight_query_in_preview(self.search_query)
+                # Apply theme colors to tk widgets and initialize status bar
+                try:
+                    self._apply_theme_to_tk_widgets()
+                except Exception:
+                    pass
+                try:
+                    self._update_status_bar()
+                except Exception:
+                    pass
+                if self.search_query:
+                    self._highlight_query_in_preview(self.search_query)
         except Exception:
             pass
         try:
@@ -5214,41 +6233,42 @@ Thanks — {signature}""",
             except Exception:
                 pass
 
+    def _fmt_pipeline(self, note: str, *steps):
+        """Run text transforms back to back on one Preview read and apply the result once.
+
+        Each step takes text and returns (new_text, removed); `note` is formatted with the
+        total as {removed}.
+        """
+        text = self._preview_text()
+        removed = 0
+        for step in steps:
+            text, n = step(text)
+            removed += n
+        self._apply_preview_text_change(text, note.format(removed=removed))
+
     def _fmt_strip_hidden(self):
-        text = self.preview.get('1.0', tk.END)
-        new_text, removed = self._count_and_strip_invisible(text)
-        self._apply_preview_text_change(new_text, f"Format: removed {removed} hidden characters")
+        self._fmt_pipeline("Format: removed {removed} hidden characters", self._count_and_strip_invisible)
 
     def _fmt_remove_blank_lines(self):
-        text = self.preview.get('1.0', tk.END)
-        new_text, removed = self._remove_blank_lines(text)
-        self._apply_preview_text_change(new_text, f"Format: removed {removed} blank lines")
+        self._fmt_pipeline("Format: removed {removed} blank lines", self._remove_blank_lines)
 
     def _fmt_strip_hidden_and_blanks(self):
-        text = self.preview.get('1.0', tk.END)
+        text = self._preview_text()
         t1, removed_hidden = self._count_and_strip_invisible(text)
         t2, removed_blanks = self._remove_blank_lines(t1)
         self._apply_preview_text_change(t2, f"Format: removed {removed_blanks} blank lines, {removed_hidden} hidden characters")
 
     def _fmt_collapse_spaces(self):
-        text = self.preview.get('1.0', tk.END)
-        new_text, removed = self._collapse_multiple_spaces(text)
-        self._apply_preview_text_change(new_text, f"Format: collapsed spaces (removed {removed} spaces)")
+        self._fmt_pipeline("Format: collapsed spaces (removed {removed} spaces)", self._collapse_multiple_spaces)
 
     def _fmt_trim_each_line(self):
-        text = self.preview.get('1.0', tk.END)
-        new_text, removed = self._trim_each_line(text)
-        self._apply_preview_text_change(new_text, f"Format: trimmed lines (removed {removed} whitespace chars)")
+        self._fmt_pipeline("Format: trimmed lines (removed {removed} whitespace chars)", self._trim_each_line)
 
     def _fmt_strip_trailing_ws(self):
-        text = self.preview.get('1.0', tk.END)
-        new_text, removed = self._strip_trailing_whitespace(text)
-        self._apply_preview_text_change(new_text, f"Format: removed {removed} trailing whitespace chars")
+        self._fmt_pipeline("Format: removed {removed} trailing whitespace chars", self._strip_trailing_whitespace)
 
     def _fmt_normalize_line_endings(self):
-        text = self.preview.get('1.0', tk.END)
-        new_text, removed = self._normalize_line_endings(text)
-        self._apply_preview_text_change(new_text, f"Format: normalized line endings (removed {removed} CR chars)")
+        self._fmt_pipeline("Format: normalized line endings (removed {removed} CR chars)", self._normalize_line_endings)
 
     def _fmt_paste_plain_text(self):
         """Paste clipboard content into Preview after stripping hidden chars."""
@@ -5266,6 +6286,7 @@ Thanks — {signature}""",
             except Exception:
                 pass
             self.preview.insert(tk.INSERT, clean)
+            self._touch_preview()
             self._preview_dirty = True
             self._update_preview_dirty_ui()
             if self.search_query:
@@ -5276,7 +6297,7 @@ Thanks — {signature}""",
 
     def _fmt_copy_preview_plain(self):
         """Copy a sanitized plain-text version of Preview to clipboard."""
-        text = self.preview.get('1.0', tk.END)
+        text = self._preview_text()
         clean, removed = self._count_and_strip_invisible(text)
         ok = self._clipboard_set_text(clean)
         if ok:
@@ -5286,14 +6307,9 @@ Thanks — {signature}""",
 
     def _fmt_open_urls_in_preview(self):
         """Find http/https URLs in Preview and open them in the default browser."""
-        text = self.preview.get('1.0', tk.END)
+        text = self._preview_text()
         # Basic URL matcher; trim common trailing punctuation
-        raw = re.findall(r"https?://\S+", text)
-        urls: list[str] = []
-        for u in raw:
-            u2 = u.rstrip(').,;\"\'<>]')
-            if u2 not in urls:
-                urls.append(u2)
+        urls = list(dict.fromkeys(u.rstrip(').,;\"\'<>]') for u in _URL_RE.findall(text)))
         if not urls:
             self._set_status_note("Open URLs: none found")
             return
@@ -5340,10 +6356,14 @@ Thanks — {signature}""",
         except Exception:
             q = ''
         self.search_query = q
+        # A newer keystroke (or a full search) abandons any scan still in flight
+        gen = self._search_gen = getattr(self, '_search_gen', 0) + 1
 
         if not q:
+            self._cancel_preview_highlight()
             try:
                 self.preview.tag_remove('match', '1.0', tk.END)
+                self._highlight_state = None
             except Exception:
                 pass
             try:
@@ -5352,6 +6372,7 @@ Thanks — {signature}""",
                 pass
             self.search_matches = []
             self.search_index = 0
+            self._last_search = None
             return
 
         ql = q.lower()
@@ -5359,45 +6380,46 @@ Thanks — {signature}""",
         # Ensure image map exists (so images can be searched even when not in Images view)
         try:
             if not hasattr(self, '_image_map_all'):
-                self._refresh_list()
+                self._refresh_list(now=True)
         except Exception:
             pass
 
-        matches = []
+        # Typing more characters can only narrow the result: every predicate (substring, subsequence,
+        # tag/name substring) that matches the longer query also matched its prefix. Re-check only
+        # the previous matches when nothing was captured/edited in between.
+        last = getattr(self, '_last_search', None)
+        if last is not None and ql.startswith(last[0]) and last[1] == self._search_state():
+            imgs = getattr(self, '_image_map_all', {}) or {}
+            text_hit = self._search_text_item
+            img_hit = self._search_image_hit
+            out = [k for k in self.search_matches if (img_hit(k, ql) if k in imgs else text_hit(k, ql))]
+            self._finish_search_live(q, ql, out, images=False)
+            return
 
-        # Text items
-        for item in list(self.history):
-            try:
-                itl = item.lower()
-                if ql in itl or self._fuzzy_match(q, item):
-                    matches.append(item)
-                    continue
-                # Tag match
-                for tg in self.tags.get(item, []) or []:
-                    if isinstance(tg, str) and ql in tg.lower():
-                        matches.append(item)
-                        break
-            except Exception:
-                pass
+        matches = []
+        items, lows = self._history_lower()
 
-        # Image keys
-        try:
-            for k, rec in (getattr(self, '_image_map_all', {}) or {}).items():
+        # Text items, scanned in chunks between idle callbacks so typing stays responsive
+        def step(start: int):
+            if gen != self._search_gen:
+                return
+            end = start + self.SEARCH_CHUNK
+            matches.extend(self._search_text_items(ql, items[start:end], lows[start:end]))
+            nxt = end
+            if nxt < len(items):
                 try:
-                    name = ''
-                    if isinstance(rec, dict):
-                        name = str(rec.get('id') or '') + ' ' + os.path.basename(str(rec.get('path') or ''))
-                    if ql and name and ql in name.lower():
-                        matches.append(k)
-                        continue
-                    for tg in self.tags.get(k, []) or []:
-                        if isinstance(tg, str) and ql in tg.lower():
-                            matches.append(k)
-                            break
+                    self.after_idle(step, nxt)
+                    return
                 except Exception:
-                    pass
-        except Exception:
-            pass
+                    return step(nxt)
+            self._finish_search_live(q, ql, matches)
+
+        step(0)
+
+    def _finish_search_live(self, q: str, ql: str, matches: list, images: bool = True):
+        # Image keys
+        if images:
+            matches.extend(self._search_image_keys(ql))
 
         # De-dupe while preserving order
         seen=set()
@@ -5409,28 +6431,146 @@ Thanks — {signature}""",
 
         self.search_matches = out
         self.search_index = 0
+        self._last_search = (ql, self._search_state())
+
+        # Highlight in preview once typing pauses; the match list above stays immediate
+        self._schedule_preview_highlight(q)
 
-        # Highlight in preview
         try:
-            self._highlight_query_in_preview(q)
+            self._set_status_note(f"Search: {len(out)} match(es)")
         except Exception:
             pass
 
+    def _cancel_preview_highlight(self):
+        job = getattr(self, '_highlight_job', None)
+        self._highlight_job = None
+        if job is not None:
+            try:
+                self.after_cancel(job)
+            except Exception:
+                pass
+
+    def _schedule_preview_highlight(self, q: str):
+        self._cancel_preview_highlight()
+
+        def run():
+            self._highlight_job = None
+            # Only the query still in the box is worth painting
+            if self.search_query == q:
+                try:
+                    self._highlight_query_in_preview(q)
+                except Exception:
+                    pass
+
         try:
-            self._set_status_note(f"Search: {len(out)} match(es)")
+            self._highlight_job = self.after(self.HIGHLIGHT_DEBOUNCE_MS, run)
         except Exception:
-            pass
+            run()
+
+    def _lower_of(self, s: str) -> str:
+        cache = self._lower_cache
+        v = cache.get(s)
+        if v is None:
+            if len(cache) > 4096:
+                cache.clear()
+            v = cache[s] = s.lower()
+        return v
+
+    def _search_tags_hit(self, key, ql: str) -> bool:
+        lower = self._lower_of
+        for tg in self.tags.get(key, ()) or ():
+            if isinstance(tg, str) and ql in lower(tg):
+                return True
+        return False
+
+    def _search_text_item(self, item: str, ql: str) -> bool:
+        """Search predicate for a history item: substring, fuzzy subsequence, or tag match."""
+        try:
+            itl = self._lower_of(item)
+            return self._fuzzy_match_lower(ql, itl) or self._search_tags_hit(item, ql)
+        except Exception:
+            return False
+
+    def _history_lower(self) -> tuple[list, list]:
+        """(history snapshot, lowercased copies), rebuilt only when history changed."""
+        hist = self.history
+        sig = (id(hist), len(hist), hist[-1] if hist else None, getattr(self, '_history_version', 0))
+        cached = getattr(self, '_history_lower_cache', None)
+        if cached is None or cached[0] != sig:
+            items = list(hist)
+            cached = self._history_lower_cache = (sig, items, [str(t).lower() for t in items])
+        return cached[1], cached[2]
+
+    def _search_tag_keys(self, ql: str) -> set:
+        """Item keys carrying a tag that contains ql, read off the tag index."""
+        idx = self._ensure_tag_index()
+        cached = getattr(self, '_search_tag_keys_cache', None)
+        if cached is not None and cached[0] is idx and cached[1] == ql:
+            return cached[2]
+        lower = self._lower_of
+        keys = set()
+        for tg, ks in idx.items():
+            if isinstance(tg, str) and ql in lower(tg):
+                keys |= ks
+        self._search_tag_keys_cache = (idx, ql, keys)
+        return keys
+
+    def _search_text_items(self, ql: str, items: list, lows: list) -> list:
+        """Batch form of _search_text_item over parallel item / lowercased lists."""
+        try:
+            match = self._fuzzy_pattern(ql).match
+            tagged = self._search_tag_keys(ql)
+            return [it for it, lo in zip(items, lows) if ql in lo or match(lo) or it in tagged]
+        except Exception:
+            hit = self._search_text_item
+            return [it for it in items if hit(it, ql)]
+
+    def _image_search_name_map(self) -> dict:
+        """{image key: lowercased 'id filename'}, cached per image map."""
+        imgs = getattr(self, '_image_map_all', {}) or {}
+        cached = getattr(self, '_image_search_names', None)
+        if cached is None or cached[0] is not imgs:
+            names = {}
+            for k, rec in imgs.items():
+                try:
+                    if isinstance(rec, dict):
+                        names[k] = (str(rec.get('id') or '') + ' ' + os.path.basename(str(rec.get('path') or ''))).lower()
+                except Exception:
+                    pass
+            cached = self._image_search_names = (imgs, names)
+        return cached[1]
+
+    def _search_image_hit(self, key, ql: str) -> bool:
+        try:
+            name = self._image_search_name_map().get(key)
+            return bool(ql and name and ql in name) or self._search_tags_hit(key, ql)
+        except Exception:
+            return False
+
+    def _search_image_keys(self, ql: str) -> list:
+        """Image keys whose id/filename or tags contain ql."""
+        hit = self._search_image_hit
+        return [k for k in (getattr(self, '_image_map_all', {}) or {}) if hit(k, ql)]
+
+    def _search_state(self) -> tuple:
+        """Cheap fingerprint of what search scans; a change disables prefix narrowing."""
+        hist = self.history
+        return (id(hist), len(hist), hist[-1] if hist else None,
+                getattr(self, '_tags_version', 0), id(getattr(self, '_image_map_all', None)))
 
     def _search(self):
         q = self.search_var.get().strip()
         self.search_query = q
+        self._search_gen = getattr(self, '_search_gen', 0) + 1
         self.search_matches = []
         self.search_index = 0
+        self._last_search = None
 
         if not q:
             self.status_var.set('Search cleared.')
             try:
                 self.preview.tag_remove('match', '1.0', tk.END)
+                self._highlight_state = None
             except Exception:
                 pass
             return
@@ -5440,43 +6580,17 @@ Thanks — {signature}""",
         # Ensure image map exists
         try:
             if not hasattr(self, '_image_map_all'):
-                self._refresh_list()
+                self._refresh_list(now=True)
         except Exception:
             pass
 
         matches = []
 
         # Text history matches
-        for item in list(self.history):
-            try:
-                if ql in item.lower() or self._fuzzy_match(q, item):
-                    matches.append(item)
-                    continue
-                for tg in self.tags.get(item, []) or []:
-                    if isinstance(tg, str) and ql in tg.lower():
-                        matches.append(item)
-                        break
-            except Exception:
-                pass
+        matches = self._search_text_items(ql, *self._history_lower())
 
         # Image matches (by id/filename or by tag)
-        try:
-            for k, rec in (getattr(self, '_image_map_all', {}) or {}).items():
-                try:
-                    name = ''
-                    if isinstance(rec, dict):
-                        name = str(rec.get('id') or '') + ' ' + os.path.basename(str(rec.get('path') or ''))
-                    if name and ql in name.lower():
-                        matches.append(k)
-                        continue
-                    for tg in self.tags.get(k, []) or []:
-                        if isinstance(tg, str) and ql in tg.lower():
-                            matches.append(k)
-                            break
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        matches.extend(self._search_image_keys(ql))
 
         # De-dupe
         seen=set(); out=[]
@@ -5488,11 +6602,13 @@ Thanks — {signature}""",
             self.status_var.set(f'No matches for: {q}')
             try:
                 self.preview.tag_remove('match', '1.0', tk.END)
+                self._highlight_state = None
             except Exception:
                 pass
             return
 
         self.search_matches = out
+        self._last_search = (ql, self._search_state())
         self.status_var.set(f'Found {len(out)} matches for: {q}')
         self._jump_to_item(out[0], highlight_query=q)
 
@@ -5512,23 +6628,23 @@ Thanks — {signature}""",
                         self.filter_var.set('img')
                     except Exception:
                         pass
-                    self._refresh_list()
+                    self._refresh_list(now=True)
         except Exception:
             pass
 
-        if item_text not in self.view_items and self._current_filter() != 'all':
+        if self._view_pos(item_text) is None and self._current_filter() != 'all':
             try:
                 # Fallback to all for text items
                 if not self._is_image_key(item_text):
                     self.filter_var.set('all')
             except Exception:
                 pass
-            self._refresh_list()
+            self._refresh_list(now=True)
 
-        if item_text not in self.view_items:
+        idx = self._view_pos(item_text)
+        if idx is None:
             return
 
-        idx = self.view_items.index(item_text)
         self.listbox.selection_clear(0, tk.END)
         self.listbox.selection_set(idx)
         self.listbox.see(idx)
@@ -5560,11 +6676,13 @@ Thanks — {signature}""",
         path = filedialog.asksaveasfilename(
             title="Export Data",
             defaultextension=".json",
-            filetypes=[("JSON", "*.json")],
+            filetypes=[("JSON", "*.json"), ("Copy 2.0 package (JSON + raw images)", "*.zip")],
             initialfile="copy2_export.json",
         )
         if not path:
             return
+        # .zip packages keep image bytes as raw archive members instead of base64 inside the JSON
+        as_package = str(path).lower().endswith('.zip')
 
         payload = {
             "exported_at": now_ts(),
@@ -5580,32 +6698,47 @@ Thanks — {signature}""",
             "images": list(getattr(self, 'images', []) or []),
         }
 
+        # Encrypt export if Encrypt-Exports OR Encrypt-All is enabled.
+        try:
+            want_enc = bool(getattr(self.settings, 'advanced_features', False) and (getattr(self.settings, 'adv_encrypt_exports', False) or getattr(self.settings, 'adv_encrypt_all_data', False)))
+        except Exception:
+            want_enc = False
+        # Encrypted exports keep the images inside the encrypted JSON envelope
+        raw_images = as_package and not (want_enc and Fernet is not None)
+
         # Embed image bytes (best-effort) so exports are self-contained
         imgs_blob = []
+        pkg_files = []  # (archive name, bytes) for package exports
         try:
-            import base64
             for rec in list(getattr(self, 'images', []) or []):
                 b = self._load_image_bytes(rec)
                 if b is None:
                     continue
-                imgs_blob.append({
+                # Real image format: recorded when the file was encrypted, else the file suffix
+                ext = str(rec.get('ext') or '').lstrip('.').lower()
+                if not ext:
+                    ext = Path(str(rec.get('path') or '')).suffix.lstrip('.').lower()
+                    if ext in ('', 'c2img'):
+                        ext = 'png'
+                entry = {
                     'id': rec.get('id'),
                     'created_at': rec.get('created_at'),
                     'name': os.path.basename(str(rec.get('path') or '')),
-                    'data_b64': base64.b64encode(b).decode('ascii'),
-                })
+                    'ext': ext,
+                }
+                if raw_images:
+                    entry['file'] = f"images/img_{len(pkg_files)}.{ext}"
+                    pkg_files.append((entry['file'], b))
+                else:
+                    entry['data_b64'] = base64.b64encode(b).decode('ascii')
+                imgs_blob.append(entry)
         except Exception:
             imgs_blob = []
+            pkg_files = []
         payload['images_blob'] = imgs_blob
 
         out_obj = payload
 
-        # Encrypt export if Encrypt-Exports OR Encrypt-All is enabled.
-        try:
-            want_enc = bool(getattr(self.settings, 'advanced_features', False) and (getattr(self.settings, 'adv_encrypt_exports', False) or getattr(self.settings, 'adv_encrypt_all_data', False)))
-        except Exception:
-            want_enc = False
-
         if want_enc:
             if Fernet is None:
                 messagebox.showwarning(APP_NAME, 'Export encryption requires cryptography (Fernet). Exporting plaintext instead.')
@@ -5622,22 +6755,39 @@ Thanks — {signature}""",
                     self._session_pin = str(pin).strip()
                 out_obj = {
                     '__copy2_export_enc__': 1,
-                    'env': self._encrypt_json_obj(payload, self._session_pin)
+                    # Export files stay on the v1 (Fernet) envelope so older builds can import them
+                    'env': self._encrypt_json_obj(payload, self._session_pin, legacy=True)
                 }
 
         try:
-            Path(path).write_text(json.dumps(out_obj, ensure_ascii=False, indent=2), encoding="utf-8")
+            if as_package:
+                with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+                    zf.writestr(EXPORT_MANIFEST, json_dumps_bytes(out_obj))
+                    for name, b in pkg_files:
+                        # Image data is already compressed; store it as-is
+                        zf.writestr(name, b, compress_type=zipfile.ZIP_STORED)
+            else:
+                # Encrypted envelopes are one opaque token; indenting them only adds bytes
+                json_dump_file(out_obj, path, indent=None if out_obj is not payload else 2)
             self.status_var.set(f"Exported — {path}")
         except Exception as e:
             messagebox.showerror(APP_NAME, f"Export failed:\n{e}")
 
     def _import(self):
-        path = filedialog.askopenfilename(title="Import Data", filetypes=[("JSON", "*.json")])
+        path = filedialog.askopenfilename(title="Import Data", filetypes=[("JSON / Copy 2.0 package", "*.json *.zip"), ("JSON", "*.json"), ("Copy 2.0 package", "*.zip")])
         if not path:
             return
 
+        pkg_files = {}  # archive member -> bytes (package imports)
         try:
-            raw = json.loads(Path(path).read_text(encoding="utf-8", errors='ignore'))
+            if zipfile.is_zipfile(path):
+                with zipfile.ZipFile(path) as zf:
+                    raw = json_loads_bytes(zf.read(EXPORT_MANIFEST))
+                    for name in zf.namelist():
+                        if name.startswith('images/'):
+                            pkg_files[name] = zf.read(name)
+            else:
+                raw = json.loads(Path(path).read_text(encoding="utf-8", errors='ignore'))
         except Exception as e:
             messagebox.showerror(APP_NAME, f"Import failed:\n{e}")
             return
@@ -5682,24 +6832,19 @@ Thanks — {signature}""",
                     if isinstance(item, str) and item.strip():
                         merged.append(item)
 
-            # Stable de-dupe (keep latest occurrences)
-            seen = set()
-            out = []
-            for item in reversed(merged):
-                if item not in seen:
-                    out.append(item)
-                    seen.add(item)
+            # Stable de-dupe (keep latest occurrences) in one hashed pass
+            out = list(dict.fromkeys(reversed(merged)))
             out.reverse()
 
             # Merge favorites/pins
             if isinstance(favorites, list):
                 for x in favorites:
-                    if isinstance(x, str) and x not in self.favorites:
-                        self.favorites.append(x)
+                    if isinstance(x, str):
+                        self._ordered_add('favorites', x)
             if isinstance(pins, list):
                 for x in pins:
-                    if isinstance(x, str) and x not in self.pins:
-                        self.pins.append(x)
+                    if isinstance(x, str):
+                        self._ordered_add('pins', x)
 
             # Merge tags/colors/expiry
             if isinstance(tags, dict):
@@ -5710,7 +6855,9 @@ Thanks — {signature}""",
                         for t in v:
                             if isinstance(t, str) and t not in cur_set:
                                 cur.append(t)
-                        self.tags[k] = cur
+                                cur_set.add(t)
+                        if cur:
+                            self.tags[k] = cur
             if isinstance(tag_colors, dict):
                 self.tag_colors.update({k: v for k, v in tag_colors.items() if isinstance(k, str) and isinstance(v, str)})
             if isinstance(expiry, dict):
@@ -5722,7 +6869,6 @@ Thanks — {signature}""",
 
             # Import images (prefer embedded blobs)
             try:
-                import base64
                 self.images_dir.mkdir(parents=True, exist_ok=True)
                 existing_ids = set([str(r.get('id') or '') for r in (getattr(self, 'images', []) or [])])
                 for blob in images_blob:
@@ -5731,18 +6877,22 @@ Thanks — {signature}""",
                         continue
                     if bid in existing_ids:
                         continue
-                    b = base64.b64decode(str(blob.get('data_b64') or ''))
-                    fname = f"img_{bid}.png"
+                    b = pkg_files.get(blob.get('file')) if blob.get('file') else None
+                    if b is None:
+                        b = base64.b64decode(str(blob.get('data_b64') or ''))
+                    ext = str(blob.get('ext') or Path(str(blob.get('file') or '')).suffix).lstrip('.').lower()
+                    if not ext.isalnum():
+                        ext = 'png'
+                    fname = f"img_{bid}.{ext}"
                     fpath = self.images_dir / fname
                     # Respect Encrypt-All
                     if self._enc_all_enabled() and getattr(self, '_session_pin', None) and Fernet is not None:
-                        env = self._encrypt_json_obj({'data_b64': base64.b64encode(b).decode('ascii'), 'ext': 'png'}, self._session_pin)
                         fpath = self.images_dir / f"img_{bid}.c2img"
-                        Path(fpath).write_text(json.dumps(env, ensure_ascii=False, indent=2), encoding='utf-8')
+                        Path(fpath).write_bytes(self._encrypt_image_bytes(b, self._session_pin, ext=ext))
                     else:
                         Path(fpath).write_bytes(b)
 
-                    rec = {'id': bid, 'path': str(fpath), 'created_at': blob.get('created_at') or now_ts()}
+                    rec = {'id': bid, 'path': str(fpath), 'created_at': blob.get('created_at') or now_ts(), 'ext': ext}
                     if not isinstance(getattr(self, 'images', None), list):
                         self.images = []
                     self.images.append(rec)
@@ -5806,6 +6956,19 @@ Thanks — {signature}""",
         nb.add(tab_advanced, text='Advanced')
         nb.add(tab_help, text='Help')
 
+        # Only General is built up front; the other tabs are filled in the first time they are shown
+        _tab_builders = {}
+
+        def _on_tab_changed(_event=None):
+            try:
+                builder = _tab_builders.pop(str(nb.select()), None)
+            except Exception:
+                builder = None
+            if builder is not None:
+                builder()
+
+        nb.bind('<<NotebookTabChanged>>', _on_tab_changed, add='+')
+
         # -----------------
         # General tab
         # -----------------
@@ -5849,49 +7012,52 @@ Thanks — {signature}""",
         # -----------------
         # Hotkeys tab
         # -----------------
-        h = tab_hotkeys
-        h.columnconfigure(1, weight=1)
-
         hk_en_var = tk.BooleanVar(value=getattr(self.settings, 'enable_global_hotkeys', False))
         hk_qp_var = tk.StringVar(value=getattr(self.settings, 'hotkey_quick_paste', 'ctrl+alt+v'))
         hk_pl_var = tk.StringVar(value=getattr(self.settings, 'hotkey_paste_last', 'ctrl+alt+shift+v'))
 
-        ttk.Checkbutton(h, text="Enable global hotkeys (requires 'keyboard')", variable=hk_en_var).grid(row=0, column=0, columnspan=2, sticky='w', padx=10, pady=(12,8))
-        ttk.Label(h, text="Quick Paste hotkey:").grid(row=1, column=0, sticky='w', padx=10, pady=6)
-        ttk.Entry(h, textvariable=hk_qp_var, width=28).grid(row=1, column=1, sticky='w', padx=10, pady=6)
-        ttk.Label(h, text="Paste last hotkey:").grid(row=2, column=0, sticky='w', padx=10, pady=6)
-        ttk.Entry(h, textvariable=hk_pl_var, width=28).grid(row=2, column=1, sticky='w', padx=10, pady=6)
+        def _build_hotkeys_tab():
+            h = tab_hotkeys
+            h.columnconfigure(1, weight=1)
+
+            ttk.Checkbutton(h, text="Enable global hotkeys (requires 'keyboard')", variable=hk_en_var).grid(row=0, column=0, columnspan=2, sticky='w', padx=10, pady=(12,8))
+            ttk.Label(h, text="Quick Paste hotkey:").grid(row=1, column=0, sticky='w', padx=10, pady=6)
+            ttk.Entry(h, textvariable=hk_qp_var, width=28).grid(row=1, column=1, sticky='w', padx=10, pady=6)
+            ttk.Label(h, text="Paste last hotkey:").grid(row=2, column=0, sticky='w', padx=10, pady=6)
+            ttk.Entry(h, textvariable=hk_pl_var, width=28).grid(row=2, column=1, sticky='w', padx=10, pady=6)
+
+        _tab_builders[str(tab_hotkeys)] = _build_hotkeys_tab
 
         # -----------------
         # Sync tab
         # -----------------
-        s = tab_sync
-        s.columnconfigure(1, weight=1)
         sync_en_var = tk.BooleanVar(value=getattr(self.settings, 'sync_enabled', False))
         sync_folder_var = tk.StringVar(value=getattr(self.settings, 'sync_folder', ''))
         sync_int_var = tk.StringVar(value=str(getattr(self.settings, 'sync_interval_sec', 10)))
 
-        ttk.Checkbutton(s, text="Enable sync to folder", variable=sync_en_var).grid(row=0, column=0, columnspan=2, sticky='w', padx=10, pady=(12,8))
-        ttk.Label(s, text="Sync folder:").grid(row=1, column=0, sticky='w', padx=10, pady=6)
-        ttk.Entry(s, textvariable=sync_folder_var, width=46).grid(row=1, column=1, sticky='ew', padx=10, pady=6)
+        def _build_sync_tab():
+            s = tab_sync
+            s.columnconfigure(1, weight=1)
+
+            ttk.Checkbutton(s, text="Enable sync to folder", variable=sync_en_var).grid(row=0, column=0, columnspan=2, sticky='w', padx=10, pady=(12,8))
+            ttk.Label(s, text="Sync folder:").grid(row=1, column=0, sticky='w', padx=10, pady=6)
+            ttk.Entry(s, textvariable=sync_folder_var, width=46).grid(row=1, column=1, sticky='ew', padx=10, pady=6)
 
-        def _browse_sync_folder():
-            d = filedialog.askdirectory(title='Choose sync folder')
-            if d:
-                sync_folder_var.set(d)
+            def _browse_sync_folder():
+                d = filedialog.askdirectory(title='Choose sync folder')
+                if d:
+                    sync_folder_var.set(d)
 
-        ttk.Button(s, text='Browse…', command=_browse_sync_folder).grid(row=2, column=1, sticky='w', padx=10, pady=(0,8))
+            ttk.Button(s, text='Browse…', command=_browse_sync_folder).grid(row=2, column=1, sticky='w', padx=10, pady=(0,8))
 
-        ttk.Label(s, text="Sync interval (sec):").grid(row=3, column=0, sticky='w', padx=10, pady=6)
-        ttk.Entry(s, textvariable=sync_int_var, width=12).grid(row=3, column=1, sticky='w', padx=10, pady=6)
+            ttk.Label(s, text="Sync interval (sec):").grid(row=3, column=0, sticky='w', padx=10, pady=6)
+            ttk.Entry(s, textvariable=sync_int_var, width=12).grid(row=3, column=1, sticky='w', padx=10, pady=6)
+
+        _tab_builders[str(tab_sync)] = _build_sync_tab
 
         # -----------------
         # Advanced tab
         # -----------------
-        a = tab_advanced
-        for c in range(3):
-            a.columnconfigure(c, weight=(1 if c == 1 else 0))
-
         adv_master_var = tk.BooleanVar(value=getattr(self.settings, 'advanced_features', False))
         adv_lock_var = tk.BooleanVar(value=getattr(self.settings, 'adv_app_lock', False))
         adv_boot_var = tk.BooleanVar(value=getattr(self.settings, 'adv_start_on_boot', False))
@@ -5903,22 +7069,6 @@ Thanks — {signature}""",
         adv_trig_var = tk.BooleanVar(value=getattr(self.settings, 'adv_tmplt_trigger', False))
         trig_word_var = tk.StringVar(value=getattr(self.settings, 'tmplt_trigger_word', 'tmplt'))
 
-        master_cb = ttk.Checkbutton(a, text='Enable Advanced Features (required for any options below)', variable=adv_master_var)
-        master_cb.grid(row=0, column=0, columnspan=3, sticky='w', padx=10, pady=(12, 8))
-
-        row = 1
-        cb_lock = ttk.Checkbutton(a, text='App-level lock (PIN required on startup)', variable=adv_lock_var)
-        cb_lock.grid(row=row, column=0, columnspan=2, sticky='w', padx=10, pady=6)
-        btn_pin = ttk.Button(a, text='Set / Change PIN…', command=lambda: self._set_or_change_pin_flow(parent=dlg))
-        btn_pin.grid(row=row, column=2, sticky='e', padx=10, pady=6)
-
-        # Separate Nuke PIN control (emergency wipe)
-        row += 1
-        ttk.Label(a, text='Nuke PIN (wipes all local + sync data)').grid(row=row, column=0, columnspan=2, sticky='w', padx=10, pady=2)
-        btn_nuke = ttk.Button(a, text='Set / Change NUKE PIN…', command=lambda: self._set_or_change_nuke_pin_flow(parent=dlg))
-        btn_nuke.grid(row=row, column=2, sticky='e', padx=10, pady=2)
-        row += 1
-
         # Inactivity auto-lock (UI-only; engine keeps running)
         cur_min = 0
         try:
@@ -5936,113 +7086,137 @@ Thanks — {signature}""",
 
         lock_custom_min_var = tk.StringVar(value=str(cur_min if cur_min not in (0, 5) else 10))
 
-        ttk.Label(a, text='Auto-lock after inactivity:').grid(row=row, column=0, sticky='w', padx=10, pady=6)
-        cmb_lock = ttk.Combobox(a, textvariable=lock_timeout_mode_var, values=['Never', '5 min', 'Custom'], state='readonly', width=10)
-        cmb_lock.grid(row=row, column=1, sticky='w', padx=10, pady=6)
-        ent_lock_custom = ttk.Entry(a, textvariable=lock_custom_min_var, width=8)
-        ent_lock_custom.grid(row=row, column=2, sticky='e', padx=10, pady=6)
+        def _build_advanced_tab():
+            a = tab_advanced
+            for c in range(3):
+                a.columnconfigure(c, weight=(1 if c == 1 else 0))
+
+            master_cb = ttk.Checkbutton(a, text='Enable Advanced Features (required for any options below)', variable=adv_master_var)
+            master_cb.grid(row=0, column=0, columnspan=3, sticky='w', padx=10, pady=(12, 8))
+
+            row = 1
+            cb_lock = ttk.Checkbutton(a, text='App-level lock (PIN required on startup)', variable=adv_lock_var)
+            cb_lock.grid(row=row, column=0, columnspan=2, sticky='w', padx=10, pady=6)
+            btn_pin = ttk.Button(a, text='Set / Change PIN…', command=lambda: self._set_or_change_pin_flow(parent=dlg))
+            btn_pin.grid(row=row, column=2, sticky='e', padx=10, pady=6)
+
+            # Separate Nuke PIN control (emergency wipe)
+            row += 1
+            ttk.Label(a, text='Nuke PIN (wipes all local + sync data)').grid(row=row, column=0, columnspan=2, sticky='w', padx=10, pady=2)
+            btn_nuke = ttk.Button(a, text='Set / Change NUKE PIN…', command=lambda: self._set_or_change_nuke_pin_flow(parent=dlg))
+            btn_nuke.grid(row=row, column=2, sticky='e', padx=10, pady=2)
+            row += 1
+
+            ttk.Label(a, text='Auto-lock after inactivity:').grid(row=row, column=0, sticky='w', padx=10, pady=6)
+            cmb_lock = ttk.Combobox(a, textvariable=lock_timeout_mode_var, values=['Never', '5 min', 'Custom'], state='readonly', width=10)
+            cmb_lock.grid(row=row, column=1, sticky='w', padx=10, pady=6)
+            ent_lock_custom = ttk.Entry(a, textvariable=lock_custom_min_var, width=8)
+            ent_lock_custom.grid(row=row, column=2, sticky='e', padx=10, pady=6)
+
+            def _lock_timeout_ui_refresh(*_):
+                try:
+                    if str(lock_timeout_mode_var.get()) == 'Custom':
+                        ent_lock_custom.configure(state='normal')
+                    else:
+                        ent_lock_custom.configure(state='disabled')
+                except Exception:
+                    pass
 
-        def _lock_timeout_ui_refresh(*_):
             try:
-                if str(lock_timeout_mode_var.get()) == 'Custom':
-                    ent_lock_custom.configure(state='normal')
-                else:
-                    ent_lock_custom.configure(state='disabled')
+                cmb_lock.bind('<<ComboboxSelected>>', _lock_timeout_ui_refresh)
             except Exception:
                 pass
+            _lock_timeout_ui_refresh()
+            row += 1
+
+            cb_boot = ttk.Checkbutton(a, text='Start on boot (Windows)', variable=adv_boot_var)
+            cb_boot.grid(row=row, column=0, columnspan=3, sticky='w', padx=10, pady=6)
+            row += 1
+
+            cb_encrypt = ttk.Checkbutton(a, text='Encrypt exports (requires PIN / passphrase)', variable=adv_encrypt_var)
+            cb_encrypt.grid(row=row, column=0, columnspan=3, sticky='w', padx=10, pady=6)
+            row += 1
+
+            cb_all = ttk.Checkbutton(a, text='Encrypt ALL local saved data (history/pins/tags/images/snippets) — requires PIN', variable=adv_all_var)
+            cb_all.grid(row=row, column=0, columnspan=3, sticky='w', padx=10, pady=6)
+            row += 1
+
+            cb_images = ttk.Checkbutton(a, text='Capture images copied to clipboard', variable=adv_images_var)
+            cb_images.grid(row=row, column=0, columnspan=3, sticky='w', padx=10, pady=6)
+            row += 1
+
+            cb_ss = ttk.Checkbutton(a, text='Enable screenshots (store as images)', variable=adv_ss_var)
+            cb_ss.grid(row=row, column=0, columnspan=2, sticky='w', padx=10, pady=6)
+            btn_ss = ttk.Button(a, text='Capture Screenshot', command=self._capture_screenshot)
+            btn_ss.grid(row=row, column=2, sticky='e', padx=10, pady=6)
+            row += 1
+
+            cb_snip = ttk.Checkbutton(a, text='Snippets / templates', variable=adv_snip_var)
+            cb_snip.grid(row=row, column=0, columnspan=2, sticky='w', padx=10, pady=6)
+            btn_sn = ttk.Button(a, text='Manage Templates…', command=self._open_snippets_manager)
+            btn_sn.grid(row=row, column=2, sticky='e', padx=10, pady=6)
+            row += 1
+
+            cb_trig = ttk.Checkbutton(a, text='Enable template trigger while typing (shows picker)', variable=adv_trig_var)
+            cb_trig.grid(row=row, column=0, sticky='w', padx=10, pady=6)
+            lbl_trig = ttk.Label(a, text='Trigger word:')
+            lbl_trig.grid(row=row, column=1, sticky='e', padx=10, pady=6)
+            ent_trig = ttk.Entry(a, textvariable=trig_word_var, width=14)
+            ent_trig.grid(row=row, column=2, sticky='e', padx=10, pady=6)
+            row += 1
+
+            btn_open_img = ttk.Button(a, text='Open Images Folder', command=self._open_images_folder)
+            btn_open_img.grid(row=row, column=2, sticky='e', padx=10, pady=(18, 0))
+            lbl_img = ttk.Label(a, text='(Images and screenshots are stored here)')
+            lbl_img.grid(row=row, column=0, columnspan=2, sticky='w', padx=10, pady=(18, 0))
+
+            # The tab's controls are all built by now: list them once, and only re-configure them
+            # when the master switch actually flips
+            _adv_toggle = {'widgets': [w for w in a.winfo_children() if w is not master_cb], 'state': None}
+
+            def _adv_controls_state(*_):
+                en = bool(adv_master_var.get())
+                st = 'normal' if en else 'disabled'
+                if st == _adv_toggle['state']:
+                    return
+                _adv_toggle['state'] = st
+                for w in _adv_toggle['widgets']:
+                    try:
+                        w.configure(state=st)
+                    except Exception:
+                        pass
 
-        try:
-            cmb_lock.bind('<<ComboboxSelected>>', _lock_timeout_ui_refresh)
-        except Exception:
-            pass
-        _lock_timeout_ui_refresh()
-        row += 1
-
-        cb_boot = ttk.Checkbutton(a, text='Start on boot (Windows)', variable=adv_boot_var)
-        cb_boot.grid(row=row, column=0, columnspan=3, sticky='w', padx=10, pady=6)
-        row += 1
-
-        cb_encrypt = ttk.Checkbutton(a, text='Encrypt exports (requires PIN / passphrase)', variable=adv_encrypt_var)
-        cb_encrypt.grid(row=row, column=0, columnspan=3, sticky='w', padx=10, pady=6)
-        row += 1
-
-        cb_all = ttk.Checkbutton(a, text='Encrypt ALL local saved data (history/pins/tags/images/snippets) — requires PIN', variable=adv_all_var)
-        cb_all.grid(row=row, column=0, columnspan=3, sticky='w', padx=10, pady=6)
-        row += 1
-
-        cb_images = ttk.Checkbutton(a, text='Capture images copied to clipboard', variable=adv_images_var)
-        cb_images.grid(row=row, column=0, columnspan=3, sticky='w', padx=10, pady=6)
-        row += 1
-
-        cb_ss = ttk.Checkbutton(a, text='Enable screenshots (store as images)', variable=adv_ss_var)
-        cb_ss.grid(row=row, column=0, columnspan=2, sticky='w', padx=10, pady=6)
-        btn_ss = ttk.Button(a, text='Capture Screenshot', command=self._capture_screenshot)
-        btn_ss.grid(row=row, column=2, sticky='e', padx=10, pady=6)
-        row += 1
-
-        cb_snip = ttk.Checkbutton(a, text='Snippets / templates', variable=adv_snip_var)
-        cb_snip.grid(row=row, column=0, columnspan=2, sticky='w', padx=10, pady=6)
-        btn_sn = ttk.Button(a, text='Manage Templates…', command=self._open_snippets_manager)
-        btn_sn.grid(row=row, column=2, sticky='e', padx=10, pady=6)
-        row += 1
-
-        cb_trig = ttk.Checkbutton(a, text='Enable template trigger while typing (shows picker)', variable=adv_trig_var)
-        cb_trig.grid(row=row, column=0, sticky='w', padx=10, pady=6)
-        lbl_trig = ttk.Label(a, text='Trigger word:')
-        lbl_trig.grid(row=row, column=1, sticky='e', padx=10, pady=6)
-        ent_trig = ttk.Entry(a, textvariable=trig_word_var, width=14)
-        ent_trig.grid(row=row, column=2, sticky='e', padx=10, pady=6)
-        row += 1
-
-        btn_open_img = ttk.Button(a, text='Open Images Folder', command=self._open_images_folder)
-        btn_open_img.grid(row=row, column=2, sticky='e', padx=10, pady=(18, 0))
-        lbl_img = ttk.Label(a, text='(Images and screenshots are stored here)')
-        lbl_img.grid(row=row, column=0, columnspan=2, sticky='w', padx=10, pady=(18, 0))
-
-        def _adv_controls_state(*_):
-            en = bool(adv_master_var.get())
-            st = 'normal' if en else 'disabled'
-            for w in a.winfo_children():
-                if w is master_cb:
-                    continue
-                try:
-                    w.configure(state=st)
-                except Exception:
-                    pass
+            adv_master_var.trace_add('write', _adv_controls_state)
+            _adv_controls_state()
 
-        adv_master_var.trace_add('write', _adv_controls_state)
-        _adv_controls_state()
+        _tab_builders[str(tab_advanced)] = _build_advanced_tab
 
 
         # -----------------
         # Help tab
         # -----------------
-        hp = tab_help
-        hp.columnconfigure(0, weight=1)
-        hp.rowconfigure(0, weight=1)
-
-        help_box = ttk.Frame(hp)
-        help_box.grid(row=0, column=0, sticky='nsew', padx=10, pady=10)
-        help_box.columnconfigure(0, weight=1)
-        help_box.rowconfigure(0, weight=1)
-
-        ysb = ttk.Scrollbar(help_box, orient='vertical')
-        ysb.grid(row=0, column=1, sticky='ns')
-        txt = tk.Text(help_box, wrap='word', yscrollcommand=ysb.set, font=('Segoe UI', 10), padx=10, pady=10)
-        txt.grid(row=0, column=0, sticky='nsew')
-        ysb.config(command=txt.yview)
-        # Accept either COPY2_HELP_TEXT (recommended) or a user-edited help_text block
-        try:
-            src = globals().get('help_text', None)
-            if src is None:
-                src = globals().get('COPY2_HELP_TEXT', '')
-            help_str = _normalize_text_block(src).strip()
-            if not help_str:
-                help_str = '(Help content is empty.)'
-            txt.insert('1.0', help_str + '\n')
-        except Exception:
-            txt.insert('1.0', '(Help content could not be loaded.)\n')
-        txt.configure(state='disabled')
+        def _build_help_tab():
+            hp = tab_help
+            hp.columnconfigure(0, weight=1)
+            hp.rowconfigure(0, weight=1)
+
+            help_box = ttk.Frame(hp)
+            help_box.grid(row=0, column=0, sticky='nsew', padx=10, pady=10)
+            help_box.columnconfigure(0, weight=1)
+            help_box.rowconfigure(0, weight=1)
+
+            ysb = ttk.Scrollbar(help_box, orient='vertical')
+            ysb.grid(row=0, column=1, sticky='ns')
+            txt = tk.Text(help_box, wrap='word', yscrollcommand=ysb.set, font=('Segoe UI', 10), padx=10, pady=10)
+            txt.grid(row=0, column=0, sticky='nsew')
+            ysb.config(command=txt.yview)
+            try:
+                txt.insert('1.0', _help_text() + '\n')
+            except Exception:
+                txt.insert('1.0', '(Help content could not be loaded.)\n')
+            txt.configure(state='disabled')
+
+        _tab_builders[str(tab_help)] = _build_help_tab
 
         # -----------------
         # Bottom buttons
@@ -6071,61 +7245,69 @@ Thanks — {signature}""",
             except Exception:
                 pass
 
+        # Settings whose runtime side effects are applied on Close rather than per autosave
+        _DEFERRED_FIELDS = {'enable_global_hotkeys', 'hotkey_quick_paste', 'hotkey_paste_last',
+                            'sync_enabled', 'sync_folder', 'sync_interval_sec'}
+        _deferred = set()
+
         def apply_settings(final: bool = False):
             """Apply settings immediately (autosave). If final=True, apply even if some fields are invalid."""
+            s = self.settings
+            # Snapshot to tell which subsystems actually need re-applying (and whether to persist at all)
+            before = dict(vars(s))
             # Numeric fields: only commit when valid to avoid noisy popups while typing
             try:
                 mh = int(str(max_var.get()).strip())
                 pm = int(str(poll_var.get()).strip())
             except Exception:
-                if final:
-                    return
+                # Keep the stored values; Close must still apply the deferred hotkey/sync changes
                 mh = None
                 pm = None
 
             if mh is not None:
                 mh = max(5, min(HARD_MAX_HISTORY, mh))
-                if mh >= HARD_MAX_HISTORY:
+                # Warn when the cap is reached, not on every later autosave that leaves it there
+                if mh >= HARD_MAX_HISTORY and mh != s.max_history:
                     try:
                         self._notify_hard_cap_reached()
                     except Exception:
                         pass
-                self.settings.max_history = mh
+                s.max_history = mh
 
             if pm is not None:
                 pm = max(100, min(5000, pm))
-                self.settings.poll_ms = pm
+                s.poll_ms = pm
 
-            self.settings.session_only = bool(sess_var.get())
-            self.settings.check_updates_on_launch = bool(upd_var.get())
+            s.session_only = bool(sess_var.get())
+            s.check_updates_on_launch = bool(upd_var.get())
 
             # Theme
             if USE_TTKB:
                 new_theme = str(theme_var.get()).strip() or 'flatly'
-                if getattr(self.settings, 'theme', '') != new_theme:
-                    self.settings.theme = new_theme
+                if getattr(s, 'theme', '') != new_theme:
+                    s.theme = new_theme
                     _apply_theme_now(new_theme)
 
             # Hotkeys
-            self.settings.enable_global_hotkeys = bool(hk_en_var.get())
-            self.settings.hotkey_quick_paste = str(hk_qp_var.get()).strip() or self.settings.hotkey_quick_paste
-            self.settings.hotkey_paste_last = str(hk_pl_var.get()).strip() or self.settings.hotkey_paste_last
+            s.enable_global_hotkeys = bool(hk_en_var.get())
+            s.hotkey_quick_paste = str(hk_qp_var.get()).strip() or s.hotkey_quick_paste
+            s.hotkey_paste_last = str(hk_pl_var.get()).strip() or s.hotkey_paste_last
 
             # Sync
-            self.settings.sync_enabled = bool(sync_en_var.get())
-            self.settings.sync_folder = str(sync_folder_var.get()).strip()
+            s.sync_enabled = bool(sync_en_var.get())
+            s.sync_folder = str(sync_folder_var.get()).strip()
             try:
-                self.settings.sync_interval_sec = max(3, min(300, int(str(sync_int_var.get()).strip())))
+                s.sync_interval_sec = max(3, min(300, int(str(sync_int_var.get()).strip())))
             except Exception:
                 pass
 
             # Advanced
-            prev_master = bool(getattr(self.settings, 'advanced_features', False))
-            prev_encrypt_all = bool(getattr(self.settings, 'adv_encrypt_all_data', False))
+            prev_master = bool(getattr(s, 'advanced_features', False))
+            prev_encrypt_all = bool(getattr(s, 'adv_encrypt_all_data', False))
 
-            self.settings.advanced_features = bool(adv_master_var.get())
-            if self.settings.advanced_features:
-                self.settings.adv_app_lock = bool(adv_lock_var.get())
+            s.advanced_features = bool(adv_master_var.get())
+            if s.advanced_features:
+                s.adv_app_lock = bool(adv_lock_var.get())
                 # Inactivity lock (UI-only). Only meaningful if App Lock is enabled.
                 mins = 0
                 try:
@@ -6137,56 +7319,73 @@ Thanks — {signature}""",
                         mins = max(1, min(24*60, mins))
                 except Exception:
                     mins = 0
-                self.settings.lock_timeout_minutes = mins if self.settings.adv_app_lock else 0
-                self.settings.adv_start_on_boot = bool(adv_boot_var.get())
-                self.settings.adv_encrypt_exports = bool(adv_encrypt_var.get())
-                self.settings.adv_encrypt_all_data = bool(adv_all_var.get())
-                self.settings.adv_images = bool(adv_images_var.get())
-                self.settings.adv_screenshots = bool(adv_ss_var.get())
-                self.settings.adv_snippets = bool(adv_snip_var.get())
-                self.settings.adv_tmplt_trigger = bool(adv_trig_var.get())
+                s.lock_timeout_minutes = mins if s.adv_app_lock else 0
+                s.adv_start_on_boot = bool(adv_boot_var.get())
+                s.adv_encrypt_exports = bool(adv_encrypt_var.get())
+                s.adv_encrypt_all_data = bool(adv_all_var.get())
+                s.adv_images = bool(adv_images_var.get())
+                s.adv_screenshots = bool(adv_ss_var.get())
+                s.adv_snippets = bool(adv_snip_var.get())
+                s.adv_tmplt_trigger = bool(adv_trig_var.get())
                 tw = str(trig_word_var.get() or '').strip()
-                self.settings.tmplt_trigger_word = tw if tw else 'tmplt'
+                s.tmplt_trigger_word = tw if tw else 'tmplt'
             else:
                 # Turning off master disables all subordinate features
-                self.settings.adv_app_lock = False
-                self.settings.adv_start_on_boot = False
-                self.settings.adv_encrypt_exports = False
-                self.settings.adv_encrypt_all_data = False
-                self.settings.lock_timeout_minutes = 0
-                self.settings.adv_images = False
-                self.settings.adv_screenshots = False
-                self.settings.adv_snippets = False
-                self.settings.adv_tmplt_trigger = False
-
-            # Enforce PIN requirement for lock/encryption
-            try:
-                if self.settings.advanced_features and (self.settings.adv_app_lock or self.settings.adv_encrypt_all_data):
+                s.adv_app_lock = False
+                s.adv_start_on_boot = False
+                s.adv_encrypt_exports = False
+                s.adv_encrypt_all_data = False
+                s.lock_timeout_minutes = 0
+                s.adv_images = False
+                s.adv_screenshots = False
+                s.adv_snippets = False
+                s.adv_tmplt_trigger = False
+
+            # Enforce PIN requirement for lock/encryption. Prompt only when one of these switches was just
+            # flipped (or on Close) - not on every autosave while the user types in another field.
+            pin_gated = ('advanced_features', 'adv_app_lock', 'adv_encrypt_all_data')
+            pin_check = final or any(getattr(s, k) != before.get(k) for k in pin_gated)
+            try:
+                if pin_check and s.advanced_features and (s.adv_app_lock or s.adv_encrypt_all_data):
                     if not self._pin_is_set():
                         if messagebox.askyesno(APP_NAME, "This feature requires a PIN.\n\nSet a PIN now?"):
                             self._set_or_change_pin_flow(parent=dlg)
                     if not self._pin_is_set():
                         # Disable dependent flags
-                        self.settings.adv_app_lock = False
-                        self.settings.adv_encrypt_all_data = False
-                        self.settings.lock_timeout_minutes = 0
+                        s.adv_app_lock = False
+                        s.adv_encrypt_all_data = False
+                        s.lock_timeout_minutes = 0
                         adv_lock_var.set(False)
                         adv_all_var.set(False)
                         messagebox.showwarning(APP_NAME, 'Feature disabled because no PIN is set.')
             except Exception:
                 pass
 
+            changed = {k for k, v in vars(s).items() if before.get(k) != v}
+            # Hotkey and sync fields are typed a character at a time; re-registering hooks or restarting
+            # the sync job for every partial value is wasted work, so those wait for Close.
+            if final:
+                changed |= _deferred
+                _deferred.clear()
+            else:
+                _deferred.update(changed & _DEFERRED_FIELDS)
+            if not changed:
+                return
+            adv_changed = any(k == 'advanced_features' or k.startswith('adv_') or k.startswith('tmplt_') for k in changed)
+            lock_changed = bool(changed & {'advanced_features', 'adv_app_lock', 'lock_timeout_minutes'})
+
             # Start on boot (apply immediately)
-            try:
-                self._set_start_on_boot(bool(self.settings.advanced_features and self.settings.adv_start_on_boot))
-            except Exception:
-                pass
+            if changed & {'advanced_features', 'adv_start_on_boot'}:
+                try:
+                    self._set_start_on_boot(bool(s.advanced_features and s.adv_start_on_boot))
+                except Exception:
+                    pass
 
             # If encrypt-all changed, ensure we have session pin (prompt) and migrate stores best-effort.
             try:
-                if prev_encrypt_all != bool(self.settings.advanced_features and self.settings.adv_encrypt_all_data):
+                if prev_encrypt_all != bool(s.advanced_features and s.adv_encrypt_all_data):
                     if Fernet is None:
-                        self.settings.adv_encrypt_all_data = False
+                        s.adv_encrypt_all_data = False
                         adv_all_var.set(False)
                         messagebox.showwarning(APP_NAME, 'Encrypt-All requires cryptography (Fernet).')
                     else:
@@ -6195,13 +7394,13 @@ Thanks — {signature}""",
                             p = simpledialog.askstring(APP_NAME, 'Enter PIN to apply encryption changes:', show='*', parent=dlg)
                             if not p or not self._verify_pin_value(p):
                                 messagebox.showerror(APP_NAME, 'Incorrect PIN. Encryption change was not applied.')
-                                self.settings.adv_encrypt_all_data = prev_encrypt_all
+                                s.adv_encrypt_all_data = prev_encrypt_all
                                 adv_all_var.set(prev_encrypt_all)
                             else:
                                 self._session_pin = str(p).strip()
                         # Migrate image files and re-save stores using the new encryption setting
                         try:
-                            self._migrate_image_files_for_encrypt_all(bool(self.settings.advanced_features and self.settings.adv_encrypt_all_data))
+                            self._migrate_image_files_for_encrypt_all(bool(s.advanced_features and s.adv_encrypt_all_data))
                         except Exception:
                             pass
                         self._persist()
@@ -6209,51 +7408,72 @@ Thanks — {signature}""",
                 pass
 
             # Update inactivity timer immediately (if enabled)
-            try:
-                self._schedule_inactivity_lock()
-            except Exception:
-                pass
+            if lock_changed:
+                try:
+                    self._schedule_inactivity_lock()
+                except Exception:
+                    pass
 
             # Re-bootstrap advanced hooks
-            try:
-                self._advanced_bootstrap()
-            except Exception:
-                pass
+            if adv_changed:
+                try:
+                    self._advanced_bootstrap()
+                except Exception:
+                    pass
 
             # Apply history capacity (preserve favorites/pins)
+            history_trimmed = False
             try:
-                if mh is not None:
+                if mh is not None and 'max_history' in changed:
                     items = list(self.history)
                     pruned, ok = self._prune_preserving_favorites(items, mh)
                     if not ok:
                         self._notify_favorites_blocking()
                     self.history = deque(pruned[-mh:], maxlen=mh)
+                    history_trimmed = len(self.history) != len(items)
             except Exception:
                 pass
 
-            try:
-                self._refresh_list(select_last=True)
-            except Exception:
-                pass
+            # Raising the cap keeps every item, so the list only needs redrawing when items were dropped
+            if history_trimmed:
+                try:
+                    self._refresh_list(select_last=True)
+                except Exception:
+                    pass
 
-            # Persist + runtime features
-            self._persist()
-            try:
-                self._schedule_inactivity_lock()
-            except Exception:
-                pass
-            try:
-                self._register_global_hotkeys()
-            except Exception:
-                pass
-            try:
-                self._start_sync_job()
-            except Exception:
-                pass
+            # Persist + runtime features. Most edits only touch config.json, so queue that on the
+            # debounced store writer instead of rewriting every store per autosave.
+            if changed & {'session_only', 'advanced_features', 'adv_encrypt_all_data'}:
+                # These decide which stores are written, and how
+                self._persist()
+            else:
+                self._mark_dirty('settings', *(('history',) if history_trimmed else ()), now=final)
+            if not final:
+                return
+            if changed & {'enable_global_hotkeys', 'hotkey_quick_paste', 'hotkey_paste_last'}:
+                try:
+                    self._register_global_hotkeys()
+                except Exception:
+                    pass
+            if changed & {'sync_enabled', 'sync_folder', 'sync_interval_sec'}:
+                try:
+                    self._start_sync_job()
+                except Exception:
+                    pass
 
         # Debounced autosave
         _autosave_state = {'job': None, 'guard': False}
 
+        def run_autosave(final: bool = False):
+            # apply_settings writes some variables back (e.g. unticking a PIN-gated option); those
+            # writes are not user edits and must not queue another autosave
+            _autosave_state['job'] = None
+            _autosave_state['guard'] = True
+            try:
+                apply_settings(final=final)
+            finally:
+                _autosave_state['guard'] = False
+
         def schedule_autosave(*_):
             if _autosave_state['guard']:
                 return
@@ -6262,7 +7482,7 @@ Thanks — {signature}""",
                     dlg.after_cancel(_autosave_state['job'])
             except Exception:
                 pass
-            _autosave_state['job'] = dlg.after(450, lambda: apply_settings(final=False))
+            _autosave_state['job'] = dlg.after(450, run_autosave)
 
         # Wire traces
         for v in [max_var, poll_var, sess_var, upd_var, theme_var,
@@ -6278,15 +7498,26 @@ Thanks — {signature}""",
         # Apply once immediately to normalize and ensure defaults
         schedule_autosave()
 
-        ttk.Button(bottom, text='Close', command=lambda: (apply_settings(final=True), dlg.destroy())).pack(side=tk.RIGHT)
+        def close_settings():
+            try:
+                if _autosave_state['job'] is not None:
+                    dlg.after_cancel(_autosave_state['job'])
+            except Exception:
+                pass
+            run_autosave(final=True)
+            dlg.destroy()
+
+        ttk.Button(bottom, text='Close', command=close_settings).pack(side=tk.RIGHT)
+        # The window's X applies deferred settings the same way Close does
+        dlg.protocol('WM_DELETE_WINDOW', close_settings)
 
         # Select initial tab
-        tab_map = {'general': 0, 'hotkeys': 1, 'sync': 2, 'advanced': 3, 'help': 4}
-        idx = tab_map.get(str(initial_tab or '').strip().lower(), 0)
+        idx = self._SETTINGS_TAB_INDEX.get(str(initial_tab or '').strip().lower(), 0)
         try:
             nb.select(idx)
         except Exception:
             pass
+        _on_tab_changed()
 
     # -----------------------------
     # Context menu
@@ -6320,7 +7551,7 @@ Thanks — {signature}""",
                         self.listbox.selection_clear(0, tk.END)
                         self.listbox.selection_set(idx)
                         self._prev_sel_set = set(self.listbox.curselection())
-                        self._sel_order = list(self._prev_sel_set)
+                        self._sel_order = dict.fromkeys(self._prev_sel_set)
                     self._on_select()
             except Exception:
                 pass
@@ -7114,6 +8345,7 @@ if USE_TTKB:
             # we drive its scroll position from the main Preview Text widget.
 
             self.preview.bind("<KeyRelease>", self._mark_preview_dirty)
+            self.preview.bind("<<Modified>>", self._on_preview_modified)
             self.preview.bind("<MouseWheel>", lambda e: (self.preview.yview_scroll(int(-1*(e.delta/120)), "units"), self.preview_gutter.yview_scroll(int(-1*(e.delta/120)), "units"), 'break'))
 
             # --- Image preview
@@ -7241,6 +8473,7 @@ else:
             self.preview = tk.Text(root, wrap="word", undo=True)
             self.preview.pack(fill=tk.BOTH, expand=True)
             self.preview.bind("<KeyRelease>", self._mark_preview_dirty)
+            self.preview.bind("<<Modified>>", self._on_preview_modified)
 
             self.search_var = tk.StringVar(value="")
             self.filter_var = tk.StringVar(value="all")
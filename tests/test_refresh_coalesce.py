@@ -0,0 +1,56 @@
+import itertools
+
+import Copy2_Windows as c2
+
+
+class _App(c2.Copy2AppBase):
+    """Copy2AppBase without Tk: idle callbacks are queued and run by flush()."""
+
+    def __init__(self):
+        self._idle = {}
+        self._jobs = itertools.count(1)
+        self.redraws = []
+
+    def after_idle(self, fn):
+        job = next(self._jobs)
+        self._idle[job] = fn
+        return job
+
+    def after_cancel(self, job):
+        self._idle.pop(job, None)
+
+    def _refresh_list_now(self, select_last=False):
+        self.redraws.append(select_last)
+
+    def flush(self):
+        while self._idle:
+            self._idle.pop(next(iter(self._idle)))()
+
+
+def test_burst_redraws_once():
+    app = _App()
+    for _ in range(5):
+        app._refresh_list()
+    app.flush()
+    assert app.redraws == [False]
+
+
+def test_mixed_burst_keeps_latest_select_last():
+    app = _App()
+    app._refresh_list(select_last=True)
+    app._refresh_list()
+    app.flush()
+    assert app.redraws == [False]
+
+    app._refresh_list()
+    app._refresh_list(select_last=True)
+    app.flush()
+    assert app.redraws == [False, True]
+
+
+def test_now_flushes_pending_request():
+    app = _App()
+    app._refresh_list(select_last=True)
+    app._refresh_list(now=True)
+    app.flush()
+    assert app.redraws == [False]